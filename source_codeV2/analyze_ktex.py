@@ -1,39 +1,49 @@
 # احفظ هذا كملف analyze_ktex.py وشغله
+import mmap
 import struct
 
+_U32x16 = struct.Struct('<16I')
+# بايت -> حرف قابل للطباعة أو '.'
+_PRINTABLE = bytes(i if 32 <= i < 127 else 0x2E for i in range(256))
+
 def analyze_file(filepath):
-    with open(filepath, 'rb') as f:
-        data = f.read()
-    
-    print(f"حجم الملف: {len(data):,} bytes")
-    print(f"\n=== أول 128 بايت (Hex) ===")
-    
-    for i in range(0, min(128, len(data)), 16):
-        hex_part = ' '.join(f'{b:02X}' for b in data[i:i+16])
-        ascii_part = ''.join(chr(b) if 32 <= b < 127 else '.' for b in data[i:i+16])
-        print(f"{i:04X}: {hex_part:<48} | {ascii_part}")
-    
-    print(f"\n=== البحث عن توقيعات معروفة ===")
-    
-    signatures = {
-        b'KTEX': 'KTEX Texture',
-        b'DDS ': 'DDS Texture',
-        b'\x89PNG': 'PNG Image',
-        b'RIFF': 'RIFF/WAV',
-        b'FSB4': 'FMOD Sound Bank 4',
-        b'FSB5': 'FMOD Sound Bank 5',
-        b'\x1bLua': 'Compiled Lua',
-    }
-    
-    for sig, name in signatures.items():
-        pos = data.find(sig)
-        if pos != -1:
-            print(f"  {name}: وُجد في الموقع {pos} (0x{pos:X})")
-    
-    print(f"\n=== قراءة كـ أرقام (Little Endian) ===")
-    for i in range(0, min(64, len(data)), 4):
-        val = struct.unpack('<I', data[i:i+4])[0]
-        print(f"  Offset {i:2}: {val:>12} (0x{val:08X})")
+    # mmap بدل f.read(): الصفحات تُقرأ عند الحاجة فقط
+    with open(filepath, 'rb') as f, \
+         mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        print(f"حجم الملف: {len(data):,} bytes")
+        print(f"\n=== أول 128 بايت (Hex) ===")
+        
+        for i in range(0, min(128, len(data)), 16):
+            row = data[i:i+16]
+            hex_part = row.hex(' ').upper()
+            ascii_part = row.translate(_PRINTABLE).decode('ascii')
+            print(f"{i:04X}: {hex_part:<48} | {ascii_part}")
+        
+        print(f"\n=== البحث عن توقيعات معروفة ===")
+        
+        signatures = {
+            b'KTEX': 'KTEX Texture',
+            b'DDS ': 'DDS Texture',
+            b'\x89PNG': 'PNG Image',
+            b'RIFF': 'RIFF/WAV',
+            b'FSB4': 'FMOD Sound Bank 4',
+            b'FSB5': 'FMOD Sound Bank 5',
+            b'\x1bLua': 'Compiled Lua',
+        }
+        
+        # find() لكل توقيع أسرع من مسح regex واحد لكل الملف
+        for sig, name in signatures.items():
+            pos = data.find(sig)
+            if pos != -1:
+                print(f"  {name}: وُجد في الموقع {pos} (0x{pos:X})")
+        
+        print(f"\n=== قراءة كـ أرقام (Little Endian) ===")
+        if len(data) >= _U32x16.size:
+            vals = _U32x16.unpack_from(data, 0)
+        else:
+            vals = struct.unpack_from(f'<{len(data) // 4}I', data, 0)
+        for i, val in enumerate(vals):
+            print(f"  Offset {i * 4:2}: {val:>12} (0x{val:08X})")
 
 # شغل التحليل
 analyze_file('skin_classicshank.tex')
\ No newline at end of file
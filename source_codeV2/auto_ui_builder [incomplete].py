@@ -3,6 +3,59 @@ from tkinter import ttk, filedialog, messagebox
 from typing import Dict, List, Any, Callable
 
 
+def _browse_file(var: tk.StringVar):
+    """Open file selection dialog."""
+    filename = filedialog.askopenfilename()
+    if filename:
+        var.set(filename)
+
+
+# Widget factories: (row, default, name) -> tk variable bound to the new widget
+
+def _make_bool(row: ttk.Frame, default: Any, name: str) -> tk.Variable:
+    var = tk.BooleanVar(value=default if default is not None else False)
+    ttk.Checkbutton(row, variable=var).pack(side='left')
+    return var
+
+
+def _make_int(row: ttk.Frame, default: Any, name: str) -> tk.Variable:
+    var = tk.IntVar(value=default if default is not None else 0)
+    ttk.Spinbox(row, from_=-9999, to=9999, textvariable=var, width=15).pack(side='left')
+    return var
+
+
+def _make_float(row: ttk.Frame, default: Any, name: str) -> tk.Variable:
+    var = tk.DoubleVar(value=default if default is not None else 0.0)
+    ttk.Spinbox(row, from_=-9999.0, to=9999.0, increment=0.1,
+                textvariable=var, width=15).pack(side='left')
+    return var
+
+
+def _make_combo(row: ttk.Frame, default: Any, name: str) -> tk.Variable:
+    options = default if isinstance(default, list) else []
+    var = tk.StringVar(value=options[0] if options else "")
+    ttk.Combobox(row, textvariable=var, values=options, width=20).pack(side='left')
+    return var
+
+
+def _make_str_or_file(row: ttk.Frame, default: Any, name: str) -> tk.Variable:
+    """str or any other type."""
+    var = tk.StringVar(value=default if default is not None else "")
+
+    # If parameter name suggests a file/path, add a browse button
+    if any(x in name.lower() for x in ['file', 'path', 'input', 'output']):
+        entry = ttk.Entry(row, textvariable=var, width=40)
+        entry.pack(side='left', padx=(0, 5))
+
+        ttk.Button(row, text="Browse", width=8,
+                   command=lambda v=var: _browse_file(v)).pack(side='left')
+    else:
+        entry = ttk.Entry(row, textvariable=var, width=45)
+        entry.pack(side='left')
+
+    return var
+
+
 class AutoUIBuilder:
     """Auto UI builder based on tool definitions."""
 
@@ -15,6 +68,15 @@ class AutoUIBuilder:
         list: 'combobox',
     }
 
+    # Type -> widget factory (List[...] hints are resolved to list first)
+    _WIDGET_FACTORIES = {
+        bool: _make_bool,
+        int: _make_int,
+        float: _make_float,
+        list: _make_combo,
+        str: _make_str_or_file,
+    }
+
     def __init__(self, parent: tk.Widget):
         self.parent = parent
         self.input_widgets = {}  # Store input widgets
@@ -22,6 +84,8 @@ class AutoUIBuilder:
     def build_tool_frame(self, tool_info: Dict) -> ttk.Frame:
         """Build a complete frame for a tool."""
         frame = ttk.Frame(self.parent)
+        # Hold geometry propagation while children are added; one reflow at the end
+        frame.pack_propagate(False)
 
         # Header section
         header = ttk.Frame(frame)
@@ -47,8 +111,10 @@ class AutoUIBuilder:
 
         self.input_widgets[tool_info['name']] = {}
 
+        inputs_frame.pack_propagate(False)
         for param in tool_info['parameters']:
             self._create_input_widget(inputs_frame, param, tool_info['name'])
+        inputs_frame.pack_propagate(True)
 
         # Execute button
         btn_frame = ttk.Frame(frame)
@@ -68,70 +134,26 @@ class AutoUIBuilder:
         self.result_text = tk.Text(result_frame, height=8, wrap='word')
         self.result_text.pack(fill='both', expand=True)
 
+        frame.pack_propagate(True)
+        frame.update_idletasks()
+
         return frame
 
-    def _create_input_widget(self, parent: ttk.Frame, param: Dict, tool_name: str):
+    def _create_input_widget(self, parent: ttk.Frame, param, tool_name: str):
         """Create an input widget based on the parameter type."""
         row = ttk.Frame(parent)
         row.pack(fill='x', pady=5)
 
         # Label
-        label_text = param['name'].replace('_', ' ').title()
-        if param['required']:
+        label_text = param.name.replace('_', ' ').title()
+        if param.required:
             label_text += " *"
         ttk.Label(row, text=label_text, width=20).pack(side='left')
 
-        param_type = param['type']
-        default = param.get('default', None)
-
-        # Determine widget type
-        if param_type == bool:
-            var = tk.BooleanVar(value=default if default is not None else False)
-            widget = ttk.Checkbutton(row, variable=var)
-            widget.pack(side='left')
-            self.input_widgets[tool_name][param['name']] = var
-
-        elif param_type == int:
-            var = tk.IntVar(value=default if default is not None else 0)
-            widget = ttk.Spinbox(row, from_=-9999, to=9999, textvariable=var, width=15)
-            widget.pack(side='left')
-            self.input_widgets[tool_name][param['name']] = var
-
-        elif param_type == float:
-            var = tk.DoubleVar(value=default if default is not None else 0.0)
-            widget = ttk.Spinbox(row, from_=-9999.0, to=9999.0, increment=0.1,
-                                 textvariable=var, width=15)
-            widget.pack(side='left')
-            self.input_widgets[tool_name][param['name']] = var
-
-        elif param_type == list or (hasattr(param_type, '__origin__') and param_type.__origin__ == list):
-            options = default if isinstance(default, list) else []
-            var = tk.StringVar(value=options[0] if options else "")
-            widget = ttk.Combobox(row, textvariable=var, values=options, width=20)
-            widget.pack(side='left')
-            self.input_widgets[tool_name][param['name']] = var
-
-        else:  # str or any other type
-            var = tk.StringVar(value=default if default is not None else "")
-
-            # If parameter name suggests a file/path, add a browse button
-            if any(x in param['name'].lower() for x in ['file', 'path', 'input', 'output']):
-                entry = ttk.Entry(row, textvariable=var, width=40)
-                entry.pack(side='left', padx=(0, 5))
-
-                ttk.Button(row, text="Browse", width=8,
-                           command=lambda v=var: self._browse_file(v)).pack(side='left')
-            else:
-                entry = ttk.Entry(row, textvariable=var, width=45)
-                entry.pack(side='left')
-
-            self.input_widgets[tool_name][param['name']] = var
-
-    def _browse_file(self, var: tk.StringVar):
-        """Open file selection dialog."""
-        filename = filedialog.askopenfilename()
-        if filename:
-            var.set(filename)
+        # Determine widget type (List[...] annotations resolve to list)
+        param_type = getattr(param.type, '__origin__', param.type)
+        factory = self._WIDGET_FACTORIES.get(param_type, _make_str_or_file)
+        self.input_widgets[tool_name][param.name] = factory(row, param.default, param.name)
 
     def _execute_tool(self, tool_info: Dict):
         """Execute the tool with the provided inputs."""
@@ -139,14 +161,14 @@ class AutoUIBuilder:
             # Gather input values
             kwargs = {}
             for param in tool_info['parameters']:
-                var = self.input_widgets[tool_info['name']].get(param['name'])
+                var = self.input_widgets[tool_info['name']].get(param.name)
                 if var is not None:
                     value = var.get()
                     # Check required fields
-                    if param['required'] and (value is None or value == "" or (isinstance(value, str) and not value.strip())):
-                        messagebox.showerror("Error", f"Field '{param['name']}' is required!")
+                    if param.required and (value is None or value == "" or (isinstance(value, str) and not value.strip())):
+                        messagebox.showerror("Error", f"Field '{param.name}' is required!")
                         return
-                    kwargs[param['name']] = value
+                    kwargs[param.name] = value
 
             # Call the tool function
             result = tool_info['function'](**kwargs)
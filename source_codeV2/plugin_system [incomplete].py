@@ -2,12 +2,17 @@ import os
 import ast
 import importlib.util
 import inspect
+from collections import namedtuple
+from functools import cached_property
 from tkinter import ttk, filedialog, messagebox
 from typing import Callable, Dict, List, Any
 
 # Store registered tool metadata
 _registered_tools = {}
 
+# One entry per tool parameter (attribute access for the UI builder)
+ParamInfo = namedtuple('ParamInfo', 'name type default required')
+
 
 def tool(name: str = None, description: str = "", icon: str = "Tool", category: str = "General"):
     """
@@ -31,78 +36,176 @@ def tool(name: str = None, description: str = "", icon: str = "Tool", category:
     return decorator
 
 
-def _extract_parameters(func: Callable) -> List[Dict]:
+def _extract_parameters(func: Callable) -> List[ParamInfo]:
     """Extract parameter metadata from a function signature."""
-    params = []
     sig = inspect.signature(func)
-    type_hints = getattr(func, '__annotations__', {})
-    
-    for param_name, param in sig.parameters.items():
-        param_type = type_hints.get(param_name, str)
-        default_value = None if param.default == inspect.Parameter.empty else param.default
-        is_required = param.default == inspect.Parameter.empty
-        
-        param_info = {
-            'name': param_name,
-            'type': param_type,
-            'default': default_value,
-            'required': is_required
-        }
-        params.append(param_info)
-    
+    func.__signature__ = sig  # later inspect.signature() calls reuse it
+    type_hints = inspect.get_annotations(func)
+    empty = inspect.Parameter.empty
+
+    return [
+        ParamInfo(
+            name=param_name,
+            type=type_hints.get(param_name, str),
+            default=None if param.default is empty else param.default,
+            required=param.default is empty
+        )
+        for param_name, param in sig.parameters.items()
+    ]
+
+
+# Annotation names understood without importing the plugin
+_AST_TYPE_NAMES = {'str': str, 'int': int, 'float': float, 'bool': bool, 'list': list, 'List': list}
+
+
+def _ast_literal(node: ast.AST, fallback: Any = None) -> Any:
+    try:
+        return ast.literal_eval(node)
+    except ValueError:
+        return fallback
+
+
+def _ast_parameters(func_node: ast.FunctionDef) -> List[ParamInfo]:
+    """Build ParamInfo entries from a function definition's AST."""
+    args = func_node.args
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    pairs = list(zip(positional, defaults)) + list(zip(args.kwonlyargs, args.kw_defaults))
+
+    params = []
+    for arg, default in pairs:
+        annotation = arg.annotation
+        if annotation is None:
+            param_type = str
+        else:
+            if isinstance(annotation, ast.Subscript):  # List[str] -> list
+                annotation = annotation.value
+            type_name = annotation.attr if isinstance(annotation, ast.Attribute) else getattr(annotation, 'id', None)
+            param_type = _AST_TYPE_NAMES.get(type_name, type_name or str)
+        params.append(ParamInfo(
+            name=arg.arg,
+            type=param_type,
+            default=None if default is None else _ast_literal(default),
+            required=default is None
+        ))
     return params
 
 
+def _scan_tool_decorators(plugin_path: str) -> List[Dict]:
+    """Read @tool(...) metadata from a plugin's source without importing it."""
+    with open(plugin_path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=plugin_path)
+
+    stubs = []
+    for node in ast.walk(tree):
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for deco in node.decorator_list:
+            if not isinstance(deco, ast.Call):
+                continue
+            target = deco.func
+            deco_name = target.attr if isinstance(target, ast.Attribute) else getattr(target, 'id', None)
+            if deco_name != 'tool':
+                continue
+
+            info = {'name': None, 'description': "", 'icon': "Tool", 'category': "General"}
+            for key, arg in zip(('name', 'description', 'icon', 'category'), deco.args):
+                info[key] = arg
+            for kw in deco.keywords:
+                if kw.arg in info:
+                    info[kw.arg] = kw.value
+            for key, value in info.items():
+                if isinstance(value, ast.AST):
+                    info[key] = _ast_literal(value)
+            info['name'] = info['name'] or node.name.replace('_', ' ').title()
+            info['description'] = info['description'] or ast.get_docstring(node) or "No description available."
+            info['parameters'] = _ast_parameters(node)
+            stubs.append(info)
+    return stubs
+
+
+def _load_plugin_tools(plugin_name: str, plugin_path: str) -> List[Dict]:
+    """Execute a plugin module and collect its registered tools."""
+    try:
+        # Load the module dynamically
+        spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+        if spec is None or spec.loader is None:
+            print(f"Skipping invalid plugin: {plugin_name}")
+            return []
+
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+
+        # Find all functions decorated with @tool
+        tools = []
+        for attr_name in dir(module):
+            attr = getattr(module, attr_name)
+            if callable(attr) and hasattr(attr, '_tool_info'):
+                tools.append(attr._tool_info)
+
+        return tools
+
+    except Exception as e:
+        print(f"Error loading plugin '{plugin_name}': {e}")
+        return []
+
+
+class LazyPlugin:
+    """A discovered plugin file; the module is only executed on first use."""
+
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        # Metadata for listing tools and building their forms, read from the source only
+        self.tool_stubs = _scan_tool_decorators(path)
+
+    @cached_property
+    def tools(self) -> List[Dict]:
+        """Full tool info (function, parameters), importing the plugin once."""
+        return _load_plugin_tools(self.name, self.path)
+
+    def get_tool(self, tool_name: str) -> Dict:
+        """Return the executable tool info for a stub, importing the plugin if needed."""
+        for tool_info in self.tools:
+            if tool_info['name'] == tool_name:
+                return tool_info
+        raise KeyError(f"Tool '{tool_name}' not found in plugin '{self.name}'")
+
+
 class PluginLoader:
     """Automatic plugin loader for tool-based extensions."""
 
     def __init__(self, plugins_folder: str = "plugins"):
         self.plugins_folder = plugins_folder
-        self.loaded_plugins = {}  # {plugin_name: [tool_info_dict, ...]}
+        self.loaded_plugins = {}  # {plugin_name: LazyPlugin}
         
-    def discover_and_load(self) -> Dict[str, List[Dict]]:
-        """Discover and load all plugin files from the plugins folder."""
+    def discover_and_load(self) -> Dict[str, LazyPlugin]:
+        """Discover plugin files; each one is imported when its tools are first used."""
         if not os.path.exists(self.plugins_folder):
             os.makedirs(self.plugins_folder)
             self._create_example_plugin()
             
         self.loaded_plugins.clear()
         
-        for filename in os.listdir(self.plugins_folder):
-            if filename.endswith('.py') and not filename.startswith('_'):
-                plugin_name = filename[:-3]
-                tools = self._load_plugin(plugin_name)
-                if tools:
-                    self.loaded_plugins[plugin_name] = tools
+        with os.scandir(self.plugins_folder) as entries:
+            for entry in entries:
+                if not (entry.name.endswith('.py') and not entry.name.startswith('_') and entry.is_file()):
+                    continue
+                plugin_name = entry.name[:-3]
+                try:
+                    plugin = LazyPlugin(plugin_name, entry.path)
+                except (OSError, SyntaxError, UnicodeDecodeError) as e:
+                    print(f"Error loading plugin '{plugin_name}': {e}")
+                    continue
+                if plugin.tool_stubs:
+                    self.loaded_plugins[plugin_name] = plugin
                     
         return self.loaded_plugins
     
     def _load_plugin(self, plugin_name: str) -> List[Dict]:
         """Load a single plugin module and extract its registered tools."""
-        try:
-            plugin_path = os.path.join(self.plugins_folder, f"{plugin_name}.py")
-            
-            # Load the module dynamically
-            spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-            if spec is None or spec.loader is None:
-                print(f"Skipping invalid plugin: {plugin_name}")
-                return []
-                
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            
-            # Find all functions decorated with @tool
-            tools = []
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if callable(attr) and hasattr(attr, '_tool_info'):
-                    tools.append(attr._tool_info)
-                    
-            return tools
-            
-        except Exception as e:
-            print(f"Error loading plugin '{plugin_name}': {e}")
-            return []
+        plugin_path = os.path.join(self.plugins_folder, f"{plugin_name}.py")
+        return _load_plugin_tools(plugin_name, plugin_path)
     
     def _create_example_plugin(self):
         """Generate a sample plugin file to guide users."""
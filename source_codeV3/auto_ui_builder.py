@@ -1,217 +1,536 @@
 """
 Auto UI Builder - Creates tool windows automatically
 """
+import re
+import time
+import asyncio
+import inspect
+import threading
+import weakref
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox
-from typing import Dict, List, Any
+from tkinter import ttk, filedialog, messagebox, font as tkfont
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Any, NamedTuple, Tuple
+
+# Named Tk fonts shared by every tool window (created once, see _ensure_fonts)
+LABEL_FONT = "ToolLabel"
+HEADER_FONT = "ToolHeader"
+SECTION_FONT = "ToolSection"
+BUTTON_FONT = "ToolButton"
+CODE_FONT = "ToolCode"
+_FONT_SPECS = {
+    LABEL_FONT: ("Arial", 10, "normal"),
+    HEADER_FONT: ("Arial", 16, "bold"),
+    SECTION_FONT: ("Arial", 11, "bold"),
+    BUTTON_FONT: ("Arial", 12, "bold"),
+    CODE_FONT: ("Consolas", 10, "normal"),
+}
+
+ENTRY_BG = "#1a1a2e"
+INVALID_BG = "#552222"
+RESULT_BG = "#0f0f1a"
+RESULT_FG = "#00ff41"
+
+# String params whose name mentions any of these get a Browse button
+FILE_PARAM_RE = re.compile(r'file|path|input|output|folder|dir')
+
+
+def _ensure_fonts(widget):
+    """Create the named fonts in widget's Tk interpreter if they are missing.
+    
+    The fonts are created with a raw "font create" call: a tkfont.Font
+    object deletes its named font when it is garbage-collected.
+    """
+    existing = set(tkfont.names(widget))
+    for name, (family, size, weight) in _FONT_SPECS.items():
+        if name not in existing:
+            widget.tk.call("font", "create", name,
+                           "-family", family, "-size", size, "-weight", weight)
+
+
+# Theme the Tool.* ttk styles were last configured for
+_styled_theme = None
+
+
+def _ensure_style(widget, theme: Dict):
+    """Configure the Tool.* ttk styles for theme (only when the theme changes)."""
+    global _styled_theme
+    key = tuple(sorted(theme.items()))
+    if key == _styled_theme:
+        return
+    bg, fg, frame_bg = theme["bg"], theme["fg"], theme["frame_bg"]
+    button_bg, button_fg = theme["button_bg"], theme["button_fg"]
+
+    # ttk only falls back from "Tool.X.TLabel" to "X.TLabel" and "TLabel",
+    # never to "Tool.TLabel", so every derived style carries its full options
+    style = ttk.Style(widget)
+    style.configure("Tool.TFrame", background=bg)
+    style.configure("Tool.TLabel", background=bg, foreground=fg, font=LABEL_FONT)
+    style.configure("Tool.Header.TLabel", background=bg, foreground=theme["accent"], font=HEADER_FONT)
+    style.configure("Tool.Param.TLabel", background=frame_bg, foreground=fg, font=LABEL_FONT)
+    style.configure("Tool.TLabelframe", background=frame_bg)
+    style.configure("Tool.TLabelframe.Label", background=frame_bg, foreground=fg, font=SECTION_FONT)
+    style.configure("Tool.TButton", background=button_bg, foreground=button_fg, font=BUTTON_FONT)
+    style.map("Tool.TButton", background=[("active", theme["button_active"])])
+    style.configure("Tool.Browse.TButton", background=button_bg, foreground=button_fg, font=LABEL_FONT)
+    style.map("Tool.Browse.TButton", background=[("active", theme["button_active"])])
+    style.configure("Tool.TCheckbutton", background=frame_bg, foreground=fg,
+                    indicatorbackground=button_bg)
+    style.map("Tool.TCheckbutton", background=[("active", frame_bg)])
+    style.configure("Tool.TEntry", fieldbackground=ENTRY_BG, foreground=fg)
+    style.configure("Tool.Invalid.TEntry", fieldbackground=INVALID_BG, foreground=fg)
+    style.configure("Tool.TSpinbox", fieldbackground=ENTRY_BG, foreground=fg)
+    _styled_theme = key
+
+
+class ParamPlan(NamedTuple):
+    """Everything the UI needs about one tool parameter, worked out once per tool."""
+    name: str
+    label: str
+    type: Any
+    default: Any
+    required: bool
+    is_file: bool
+    spec: Dict  # the raw parameter dict, for optional keys like min/max/step
+
+
+# Tool function -> its parameter plans (entries go away with the plugin)
+_PLAN_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _param_plan(tool_info: Dict) -> Tuple[ParamPlan, ...]:
+    """Parameter plans for a tool, computed on first use and then cached."""
+    function = tool_info['function']
+    plan = _PLAN_CACHE.get(function)
+    if plan is None:
+        plan = tuple(
+            ParamPlan(
+                name=param['name'],
+                label=param['name'].replace('_', ' ').title() + (" *" if param['required'] else ""),
+                type=param['type'],
+                default=param.get('default'),
+                required=param['required'],
+                is_file=bool(FILE_PARAM_RE.search(param['name'].lower())),
+                spec=param,
+            )
+            for param in tool_info['parameters'])
+        _PLAN_CACHE[function] = plan
+    return plan
+
+
+def _fast_set_text(text_widget: tk.Text, s: str):
+    """Replace all of text_widget's contents with one raw Tcl call."""
+    text_widget.tk.call(text_widget._w, 'replace', '1.0', 'end', s)
+
+
+def _fast_append_text(text_widget: tk.Text, s: str):
+    text_widget.tk.call(text_widget._w, 'insert', 'end', s)
+
+
+class ToolValidationError(Exception):
+    """Bad user input for a tool; shown in the result box without a dialog."""
+
+
+def _run_tool(function, kwargs: Dict):
+    """Run a tool on a worker thread and format its output there, off the Tk thread."""
+    try:
+        return True, "Success!\n\n" + str(function(**kwargs))
+    except Exception as e:
+        return False, e
+
+
+async def _run_tool_async(function, kwargs: Dict):
+    """Coroutine counterpart of _run_tool, run on the shared asyncio loop."""
+    try:
+        return True, "Success!\n\n" + str(await function(**kwargs))
+    except Exception as e:
+        return False, e
+
+
+_async_loop = None
+_async_loop_lock = threading.Lock()
+
+
+def _get_async_loop() -> asyncio.AbstractEventLoop:
+    """The asyncio loop for coroutine tools, started in a daemon thread on first use."""
+    global _async_loop
+    with _async_loop_lock:
+        if _async_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="tool-asyncio", daemon=True).start()
+            _async_loop = loop
+    return _async_loop
 
 
 class ToolWindow:
     """Popup window for a tool with auto-generated UI."""
 
+    __slots__ = (
+        'tool_info', 'plan', 'theme', 'on_success', 'window', 'run_btn', 'result_text',
+        'input_vars', '_initial_values', '_entries', '_marked',
+        '_all_names', '_required_names', '_built', '_result_gen', '_last_err_time',
+        '_future',
+    )
+
+    # Shared by all tool windows so tools never run on (and freeze) the Tk thread
+    _EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tool")
+
+    # Closed windows are hidden and kept for reuse, least recently opened evicted first
+    _POOL: "OrderedDict[tuple, ToolWindow]" = OrderedDict()
+    POOL_SIZE = 8
+
+    @classmethod
+    def open(cls, parent, tool_info: Dict, theme: Dict, on_success=None) -> "ToolWindow":
+        """Show the tool's window, reusing a hidden one instead of rebuilding it."""
+        key = (tool_info['name'], tool_info['function'])
+        pooled = cls._POOL.pop(key, None)
+        if pooled is not None:
+            if pooled.window.winfo_exists() and pooled.theme == theme:
+                pooled.on_success = on_success
+                pooled._reset()
+                pooled.window.deiconify()
+                pooled.window.lift()
+                cls._POOL[key] = pooled
+                return pooled
+            pooled._destroy()
+
+        window = cls(parent, tool_info, theme, on_success)
+        window.window.protocol("WM_DELETE_WINDOW", window._close)
+        cls._POOL[key] = window
+        while len(cls._POOL) > cls.POOL_SIZE:
+            _, oldest = cls._POOL.popitem(last=False)
+            if oldest.window.winfo_exists() and oldest.window.state() != "withdrawn":
+                # Still on screen: leave it open, but really close it next time
+                oldest.window.protocol("WM_DELETE_WINDOW", oldest._destroy)
+            else:
+                oldest._destroy()
+        return window
+
     def __init__(self, parent, tool_info: Dict, theme: Dict, on_success=None):
         self.tool_info = tool_info
+        self.plan = _param_plan(tool_info)
+        self._all_names = tuple(p.name for p in self.plan)
+        self._required_names = tuple(p.name for p in self.plan if p.required)
         self.theme = theme
         self.on_success = on_success
         self.input_vars = {}
+        self._initial_values = {}
+        self._entries = {}   # text entries by param name, for inline validation
+        self._marked = set() # names currently highlighted as missing
+        self._result_gen = 0  # bumped per result so stale chunked inserts stop
+        self._last_err_time = 0.0
+        self._future = None  # the running tool, if any
+        self.result_text = None  # created lazily by _ensure_result_widgets
 
         self.window = tk.Toplevel(parent)
+        _ensure_fonts(self.window)
         self.window.title(f"{tool_info['icon']} {tool_info['name']}")
         self.window.geometry("500x450")
         self.window.configure(bg=theme["bg"])
         self.window.resizable(True, True)
         
+        # Widgets are created once the window is actually mapped
+        self._built = False
+        self.window.bind("<Map>", self._build_ui_once)
+
+    def _build_ui_once(self, event=None):
+        """Build the UI on the first <Map> event only."""
+        if self._built:
+            return
+        self._built = True
+        self.window.unbind("<Map>")
         self._build_ui()
 
     def _build_ui(self):
-        t = self.theme
+        _ensure_style(self.window, self.theme)
         
         # Header
-        header = tk.Frame(self.window, bg=t["bg"])
+        header = ttk.Frame(self.window, style="Tool.TFrame")
         header.pack(fill="x", padx=20, pady=15)
 
-        tk.Label(
+        ttk.Label(
             header,
             text=f"{self.tool_info['icon']} {self.tool_info['name']}",
-            font=("Arial", 16, "bold"),
-            bg=t["bg"], fg=t["accent"]
+            style="Tool.Header.TLabel"
         ).pack(anchor="w")
 
-        tk.Label(
+        ttk.Label(
             header,
             text=self.tool_info['description'],
-            font=("Arial", 10),
-            bg=t["bg"], fg=t["fg"]
+            style="Tool.TLabel"
         ).pack(anchor="w", pady=(5, 0))
 
         # Separator
         ttk.Separator(self.window, orient="horizontal").pack(fill="x", padx=20, pady=10)
 
         # Parameters Frame
-        params_frame = tk.LabelFrame(
+        params_frame = ttk.LabelFrame(
             self.window,
             text=" Parameters ",
-            font=("Arial", 11, "bold"),
-            bg=t["frame_bg"], fg=t["fg"],
-            padx=15, pady=10
+            style="Tool.TLabelframe",
+            padding=(15, 10)
         )
         params_frame.pack(fill="x", padx=20, pady=10)
+        # One grid for all rows: label | input | browse
+        params_frame.columnconfigure(1, weight=1)
 
-        for param in self.tool_info['parameters']:
-            self._create_param_widget(params_frame, param)
+        create_param_widget = self._create_param_widget
+        for row, param in enumerate(self.plan):
+            create_param_widget(params_frame, param, row)
 
         # Execute Button
-        btn_frame = tk.Frame(self.window, bg=t["bg"])
+        btn_frame = ttk.Frame(self.window, style="Tool.TFrame")
         btn_frame.pack(fill="x", padx=20, pady=15)
 
-        self.run_btn = tk.Button(
+        self.run_btn = ttk.Button(
             btn_frame,
             text=f"▶ Run {self.tool_info['name']}",
-            font=("Arial", 12, "bold"),
-            bg=t["button_bg"], fg=t["button_fg"],
-            activebackground=t["button_active"],
+            style="Tool.TButton",
             command=self._execute,
-            height=2, width=20
+            width=20, padding=(10, 8)
         )
         self.run_btn.pack()
 
+    def _ensure_result_widgets(self) -> tk.Text:
+        """The result box, created the first time there is something to show."""
+        if self.result_text is not None:
+            return self.result_text
+
         # Result Frame
-        result_frame = tk.LabelFrame(
+        result_frame = ttk.LabelFrame(
             self.window,
             text=" Result ",
-            font=("Arial", 11, "bold"),
-            bg=t["frame_bg"], fg=t["fg"],
-            padx=10, pady=10
+            style="Tool.TLabelframe",
+            padding=10
         )
         result_frame.pack(fill="both", expand=True, padx=20, pady=(0, 20))
 
-        self.result_text = tk.Text(
+        result_text = self.result_text = tk.Text(
             result_frame,
             height=6,
-            font=("Consolas", 10),
-            bg="#0f0f1a", fg="#00ff41",
-            wrap="word"
+            font=CODE_FONT,
+            bg=RESULT_BG, fg=RESULT_FG,
+            wrap="word",
+            # Output only: no undo history of every result
+            undo=False, autoseparators=False, maxundo=0
         )
-        self.result_text.pack(fill="both", expand=True)
-
-    def _create_param_widget(self, parent, param: Dict):
-        """Create input widget based on parameter type."""
-        t = self.theme
-        
-        row = tk.Frame(parent, bg=t["frame_bg"])
-        row.pack(fill="x", pady=8)
+        result_text.pack(fill="both", expand=True)
+        return result_text
 
+    def _create_param_widget(self, parent, param: ParamPlan, row: int):
+        """Create input widget based on parameter type, in grid row `row` of parent."""
         # Label
-        label_text = param['name'].replace('_', ' ').title()
-        if param['required']:
-            label_text += " *"
-
-        tk.Label(
-            row,
-            text=label_text,
-            font=("Arial", 10),
-            bg=t["frame_bg"], fg=t["fg"],
+        ttk.Label(
+            parent,
+            text=param.label,
+            style="Tool.Param.TLabel",
             width=15, anchor="w"
-        ).pack(side="left")
-
-        param_type = param['type']
-        default = param.get('default')
-
-        # Boolean -> Checkbox
-        if param_type == bool:
-            var = tk.BooleanVar(value=default if default is not None else False)
-            cb = tk.Checkbutton(
-                row, variable=var,
-                bg=t["frame_bg"], fg=t["fg"],
-                selectcolor=t["button_bg"],
-                activebackground=t["frame_bg"]
-            )
-            cb.pack(side="left")
-            self.input_vars[param['name']] = var
-
-        # Int -> Spinbox
-        elif param_type == int:
-            var = tk.IntVar(value=default if default is not None else 0)
-            sb = tk.Spinbox(
-                row, from_=-9999, to=9999,
-                textvariable=var, width=15,
-                bg="#1a1a2e", fg=t["fg"]
-            )
-            sb.pack(side="left")
-            self.input_vars[param['name']] = var
-
-        # Float -> Spinbox
-        elif param_type == float:
-            var = tk.DoubleVar(value=default if default is not None else 0.0)
-            sb = tk.Spinbox(
-                row, from_=-9999, to=9999,
-                increment=0.1, textvariable=var, width=15,
-                bg="#1a1a2e", fg=t["fg"]
-            )
-            sb.pack(side="left")
-            self.input_vars[param['name']] = var
+        ).grid(row=row, column=0, sticky="w", pady=8)
+
+        factory = self._WIDGET_FACTORIES.get(param.type, ToolWindow._make_str)
+        var = self.input_vars[param.name] = factory(self, parent, row, param)
+        self._initial_values[param.name] = var.get()
 
-        # String (with file browser if needed)
+    def _make_bool(self, parent, row: int, param: ParamPlan) -> tk.Variable:
+        """Boolean -> Checkbox"""
+        default = param.default
+        var = tk.BooleanVar(value=default if default is not None else False)
+        ttk.Checkbutton(
+            parent, variable=var,
+            style="Tool.TCheckbutton"
+        ).grid(row=row, column=1, sticky="w", pady=8)
+        return var
+
+    def _make_int(self, parent, row: int, param: ParamPlan) -> tk.Variable:
+        """Int -> Spinbox"""
+        default = param.default
+        var = tk.IntVar(value=default if default is not None else 0)
+        ttk.Spinbox(
+            parent, from_=param.spec.get('min', -9999), to=param.spec.get('max', 9999),
+            increment=param.spec.get('step', 1),
+            textvariable=var, width=15, style="Tool.TSpinbox"
+        ).grid(row=row, column=1, sticky="w", pady=8)
+        return var
+
+    def _make_float(self, parent, row: int, param: ParamPlan) -> tk.Variable:
+        """Float -> Spinbox"""
+        default = param.default
+        var = tk.DoubleVar(value=default if default is not None else 0.0)
+        ttk.Spinbox(
+            parent, from_=param.spec.get('min', -9999), to=param.spec.get('max', 9999),
+            increment=param.spec.get('step', 0.1),
+            textvariable=var, width=15, style="Tool.TSpinbox"
+        ).grid(row=row, column=1, sticky="w", pady=8)
+        return var
+
+    def _make_str(self, parent, row: int, param: ParamPlan) -> tk.Variable:
+        """String (with file browser if needed), also the fallback for other types"""
+        default = param.default
+        var = tk.StringVar(value=default if default is not None else "")
+        
+        if param.is_file:
+            entry = ttk.Entry(parent, textvariable=var, width=30, style="Tool.TEntry")
+            entry.grid(row=row, column=1, sticky="ew", padx=(0, 5), pady=8)
+
+            browse_btn = ttk.Button(
+                parent, text="{[F]}",
+                style="Tool.Browse.TButton",
+                command=partial(self._browse, var, param.name)
+            )
+            browse_btn.grid(row=row, column=2, pady=8)
         else:
-            var = tk.StringVar(value=default if default is not None else "")
-            
-            is_file_param = any(x in param['name'].lower() for x in 
-                               ['file', 'path', 'input', 'output', 'folder', 'dir'])
-
-            if is_file_param:
-                entry = tk.Entry(row, textvariable=var, width=30, bg="#1a1a2e", fg=t["fg"])
-                entry.pack(side="left", padx=(0, 5))
-
-                browse_btn = tk.Button(
-                    row, text="{[F]}",
-                    bg=t["button_bg"], fg=t["button_fg"],
-                    command=lambda v=var, n=param['name']: self._browse(v, n)
-                )
-                browse_btn.pack(side="left")
-            else:
-                entry = tk.Entry(row, textvariable=var, width=35, bg="#1a1a2e", fg=t["fg"])
-                entry.pack(side="left")
+            entry = ttk.Entry(parent, textvariable=var, width=35, style="Tool.TEntry")
+            entry.grid(row=row, column=1, columnspan=2, sticky="ew", pady=8)
+        self._entries[param.name] = entry
+        entry.bind("<KeyRelease>", partial(self._clear_mark, param.name))
+        return var
+
+    # Parameter type -> widget factory (anything else gets a text entry)
+    _WIDGET_FACTORIES = {
+        bool: _make_bool,
+        int: _make_int,
+        float: _make_float,
+        str: _make_str,
+    }
+
+    def _reset(self):
+        """Put a reused window back to its freshly opened state."""
+        for name, value in self._initial_values.items():
+            self.input_vars[name].set(value)
+        for name in tuple(self._marked):
+            self._clear_mark(name)
+        if self.result_text is not None:
+            self._set_result("")
 
-            self.input_vars[param['name']] = var
+    def _cancel(self):
+        """Drop the running tool; coroutine tools are really cancelled."""
+        future, self._future = self._future, None
+        if future is not None:
+            future.cancel()
+
+    def _close(self):
+        """Hide the window for reuse, cancelling whatever it was running."""
+        self._cancel()
+        if self._built:
+            self.run_btn.configure(state="normal")
+        self.window.withdraw()
+
+    def _destroy(self):
+        self._cancel()
+        try:
+            self.window.destroy()
+        except tk.TclError:
+            pass  # already gone with its parent
 
     def _browse(self, var: tk.StringVar, param_name: str):
         """Open file/folder dialog."""
-        if 'folder' in param_name.lower() or 'dir' in param_name.lower():
+        name = param_name.lower()
+        if 'folder' in name or 'dir' in name:
             path = filedialog.askdirectory()
-        elif 'output' in param_name.lower():
+        elif 'output' in name:
             path = filedialog.asksaveasfilename()
         else:
             path = filedialog.askopenfilename()
         
         if path:
             var.set(path)
+            self._clear_mark(param_name)
+
+    def _mark_missing(self, name: str):
+        """Highlight a missing required entry and move focus to it."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return
+        entry.configure(style="Tool.Invalid.TEntry")
+        entry.focus_set()
+        self._marked.add(name)
+
+    def _clear_mark(self, name: str, event=None):
+        if name in self._marked:
+            self._marked.discard(name)
+            self._entries[name].configure(style="Tool.TEntry")
 
     def _execute(self):
-        """Execute the tool function."""
+        """Validate inputs, then run the tool function off the Tk thread."""
         try:
-            kwargs = {}
-            for param in self.tool_info['parameters']:
-                var = self.input_vars.get(param['name'])
-                if var:
-                    value = var.get()
-                    
-                    if param['required'] and (value is None or value == ""):
-                        messagebox.showerror("Error", f"'{param['name']}' is required!")
-                        return
-                    
-                    kwargs[param['name']] = value
-
-            # Execute
-            result = self.tool_info['function'](**kwargs)
-
-            # Show result
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, f"Success!\n\n{result}")
-
-            if self.on_success:
-                self.on_success()
+            input_vars = self.input_vars
+            kwargs = {name: input_vars[name].get() for name in self._all_names}
+            for name in self._required_names:
+                value = kwargs[name]
+                if value is None or value == "":
+                    self._mark_missing(name)
+                    raise ToolValidationError(f"'{name}' is required!")
+
+            # Execute in the background; the result is shown back on the Tk thread
+            self.run_btn.configure(state="disabled")
+            function = self.tool_info['function']
+            if inspect.iscoroutinefunction(function):
+                future = asyncio.run_coroutine_threadsafe(
+                    _run_tool_async(function, kwargs), _get_async_loop())
+            else:
+                future = self._EXECUTOR.submit(_run_tool, function, kwargs)
+            self._future = future
+            future.add_done_callback(self._schedule_done)
 
         except Exception as e:
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, f"Error:\n\n{str(e)}")
-            messagebox.showerror("Error", str(e))
\ No newline at end of file
+            self._show_error(e)
+
+    def _schedule_done(self, future):
+        """Hand the finished future back to the Tk thread (runs on the worker)."""
+        try:
+            self.window.after(0, self._on_done, future)
+        except (tk.TclError, RuntimeError):
+            pass  # window or main loop already gone
+
+    def _on_done(self, future):
+        """Show the finished tool's result (runs on the Tk thread)."""
+        if future is not self._future or not self.window.winfo_exists():
+            return  # cancelled by closing the window, or window gone
+        self._future = None
+        self.run_btn.configure(state="normal")
+        ok, text = future.result()
+        if not ok:
+            self._show_error(text)
+            return
+
+        # Show result (already formatted on the worker)
+        self._set_result(text)
+
+        if self.on_success:
+            self.on_success()
+
+    # Minimum gap between error dialogs, in seconds
+    ERROR_DIALOG_INTERVAL = 0.5
+
+    def _show_error(self, e):
+        """Show e in the result box; unexpected errors also get a (rate-limited) dialog."""
+        self._set_result(f"Error:\n\n{str(e)}")
+        if isinstance(e, ToolValidationError):
+            return
+        now = time.monotonic()
+        if now - self._last_err_time < self.ERROR_DIALOG_INTERVAL:
+            return
+        self._last_err_time = now
+        messagebox.showerror("Error", str(e))
+
+    # Large results are appended in pieces from idle callbacks
+    RESULT_CHUNK = 64 * 1024
+
+    def _set_result(self, text: str):
+        """Replace the result text; big payloads stream in without blocking the UI."""
+        self._result_gen += 1
+        chunk = self.RESULT_CHUNK
+        result_text = self._ensure_result_widgets()
+        _fast_set_text(result_text, text[:chunk])
+        if len(text) > chunk:
+            result_text.after_idle(self._append_result, text, chunk, self._result_gen)
+
+    def _append_result(self, text: str, pos: int, gen: int):
+        if gen != self._result_gen or not self.result_text.winfo_exists():
+            return  # superseded by a newer result, or window closed
+        end = pos + self.RESULT_CHUNK
+        _fast_append_text(self.result_text, text[pos:end])
+        if end < len(text):
+            self.result_text.after_idle(self._append_result, text, end, gen)
\ No newline at end of file
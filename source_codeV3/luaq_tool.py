@@ -1,6 +1,54 @@
+import re
 import struct
+from array import array
 import sys
 import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+
+# Lua source is split into tokens by one regex (run by the re engine in C)
+# instead of walking it a character at a time in Python. Whitespace and
+# comments ahead of a token are skipped as part of the same match.
+_TOKEN_RE = re.compile(r"""
+    (?:[ \t\n\r]+|--[^\n]*)*
+    (?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<int>-?[0-9]+(?![0-9.eE]))
+      | (?P<float>-?[0-9][0-9.]*(?:[eE][+-]?[0-9]*)?)
+      | (?P<name>[^\W\d]\w*)
+      | (?P<char>.)
+      | (?P<end>\Z)
+    )
+""", re.VERBOSE | re.DOTALL)
+
+_ESCAPE_RE = re.compile(r'\\(.)', re.DOTALL)
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"', "'": "'"}
+
+
+def _unescape(match):
+    char = match.group(1)
+    return _ESCAPES.get(char, char)
+
+
+def tokenize(code):
+    """Split Lua source into (kind, start, end) tokens, without whitespace and comments.
+    
+    kind is 'string', 'int', 'float' or 'name', or the character itself for anything
+    else, so the parser classifies a token with a single comparison. The list
+    ends with a (None, len(code), len(code)) end-of-input token.
+    """
+    tokens = []
+    append = tokens.append
+    for m in _TOKEN_RE.finditer(code):
+        kind = m.lastgroup
+        if kind == 'char':
+            start = m.start(kind)
+            append((code[start], start, start + 1))
+        elif kind != 'end':
+            append((kind, m.start(kind), m.end()))
+    append((None, len(code), len(code)))
+    return tokens
 
 
 class LuaParser:
@@ -8,122 +56,69 @@ class LuaParser:
     
     def __init__(self, code):
         self.code = code
-        self.pos = 0
         self.length = len(code)
+        self.tokens = tokenize(code)
+        self.index = 0
     
-    def skip_whitespace(self):
-        while self.pos < self.length:
-            if self.code[self.pos] in ' \t\n\r':
-                self.pos += 1
-            elif self.code[self.pos:self.pos+2] == '--':
-                while self.pos < self.length and self.code[self.pos] != '\n':
-                    self.pos += 1
-            else:
-                break
+    @property
+    def pos(self):
+        """Source position of the next token (end of input when there is none)"""
+        return self.tokens[self.index][1]
     
     def peek(self):
-        self.skip_whitespace()
-        if self.pos < self.length:
-            return self.code[self.pos]
-        return None
+        """Kind of the next token (None at end of input)"""
+        return self.tokens[self.index][0]
     
     def consume(self, expected=None):
-        self.skip_whitespace()
-        if expected:
-            if self.code[self.pos:self.pos+len(expected)] == expected:
-                self.pos += len(expected)
-                return expected
-            raise ValueError(f"Expected '{expected}' at position {self.pos}")
-        char = self.code[self.pos]
-        self.pos += 1
-        return char
+        kind, start, end = self.tokens[self.index]
+        if kind is None:
+            if expected is None:
+                raise ValueError(f"Unexpected end of input at position {start}")
+        elif expected is None or kind == expected:
+            self.index += 1
+            return self.code[start:end]
+        raise ValueError(f"Expected '{expected}' at position {start}")
     
     def parse_string(self):
-        self.skip_whitespace()
-        quote = self.code[self.pos]
-        if quote not in '"\'':
-            raise ValueError(f"Expected string at position {self.pos}")
-        
-        self.pos += 1
-        result = []
-        
-        while self.pos < self.length:
-            char = self.code[self.pos]
-            
-            if char == quote:
-                self.pos += 1
-                return ''.join(result)
-            elif char == '\\':
-                self.pos += 1
-                if self.pos < self.length:
-                    next_char = self.code[self.pos]
-                    escape_map = {'n': '\n', 't': '\t', 'r': '\r', '\\': '\\', '"': '"', "'": "'"}
-                    result.append(escape_map.get(next_char, next_char))
-                    self.pos += 1
-            else:
-                result.append(char)
-                self.pos += 1
-        
-        raise ValueError("Unterminated string")
+        kind, start, end = self.tokens[self.index]
+        if kind != 'string':
+            if kind is not None and kind in '"\'':
+                raise ValueError("Unterminated string")
+            raise ValueError(f"Expected string at position {start}")
+        
+        self.index += 1
+        text = self.code[start + 1:end - 1]
+        if '\\' in text:
+            text = _ESCAPE_RE.sub(_unescape, text)
+        return text
     
     def parse_number(self):
-        self.skip_whitespace()
-        start = self.pos
-        
-        if self.pos < self.length and self.code[self.pos] == '-':
-            self.pos += 1
-        
-        while self.pos < self.length and (self.code[self.pos].isdigit() or self.code[self.pos] == '.'):
-            self.pos += 1
-        
-        if self.pos < self.length and self.code[self.pos] in 'eE':
-            self.pos += 1
-            if self.pos < self.length and self.code[self.pos] in '+-':
-                self.pos += 1
-            while self.pos < self.length and self.code[self.pos].isdigit():
-                self.pos += 1
-        
-        num_str = self.code[start:self.pos]
-        
-        if '.' in num_str or 'e' in num_str.lower():
-            return float(num_str)
-        return int(num_str)
+        kind, start, end = self.tokens[self.index]
+        if kind == 'int':
+            self.index += 1
+            return int(self.code[start:end])
+        if kind == 'float':
+            self.index += 1
+            return float(self.code[start:end])
+        raise ValueError(f"Expected number at position {start}")
     
     def parse_identifier(self):
-        self.skip_whitespace()
-        start = self.pos
-        
-        while self.pos < self.length:
-            char = self.code[self.pos]
-            if char.isalnum() or char == '_':
-                self.pos += 1
-            else:
-                break
-        
-        return self.code[start:self.pos]
+        kind, start, end = self.tokens[self.index]
+        if kind == 'name':
+            self.index += 1
+            return self.code[start:end]
+        return ''
     
     def parse_value(self):
-        self.skip_whitespace()
+        kind, start, end = self.tokens[self.index]
         
-        if self.pos >= self.length:
-            return None
-        
-        char = self.peek()
-        
-        if char in '"\'':
+        if kind == 'string':
             return self.parse_string()
         
-        if char == '{':
-            return self.parse_table()
-        
-        if char == '-' or char.isdigit():
-            if char == '-':
-                if self.pos + 1 < self.length and self.code[self.pos + 1].isdigit():
-                    return self.parse_number()
-            else:
-                return self.parse_number()
+        if kind == 'int' or kind == 'float':
+            return self.parse_number()
         
-        if char.isalpha() or char == '_':
+        if kind == 'name':
             ident = self.parse_identifier()
             if ident == 'true':
                 return True
@@ -133,64 +128,72 @@ class LuaParser:
                 return None
             return ident
         
-        raise ValueError(f"Unexpected character '{char}' at position {self.pos}")
+        if kind == '{':
+            return self.parse_table()
+        
+        if kind is None:
+            return None
+        
+        if kind in '"\'':
+            raise ValueError("Unterminated string")
+        
+        raise ValueError(f"Unexpected character '{kind}' at position {start}")
     
     def parse_table(self):
         self.consume('{')
         result = {}
         array_index = 1
+        # Whether every key so far is an int >= 1, and the largest one
+        dense = True
+        max_key = 0
         
+        tokens = self.tokens
         while True:
-            self.skip_whitespace()
+            # Look at the next token once and dispatch on its kind
+            kind, start, end = tokens[self.index]
             
-            if self.peek() == '}':
-                self.consume('}')
+            if kind == '}':
+                self.index += 1
                 break
             
-            if self.peek() == '[':
-                self.consume('[')
+            if kind is None:
+                raise ValueError(f"Expected '}}' at position {self.length}")
+            
+            if kind == '[':
+                self.index += 1
                 key = self.parse_value()
                 self.consume(']')
-                self.skip_whitespace()
                 self.consume('=')
                 value = self.parse_value()
+                # A key equal to an existing one (1.0 vs 1) keeps the existing key
+                if dense and key not in result:
+                    if isinstance(key, int) and key >= 1:
+                        if key > max_key:
+                            max_key = key
+                    else:
+                        dense = False
                 result[key] = value
+            elif kind == 'name' and tokens[self.index + 1][0] == '=':
+                self.index += 2
+                result[self.code[start:end]] = self.parse_value()
+                dense = False
             else:
-                saved_pos = self.pos
-                
-                if self.peek() and (self.peek().isalpha() or self.peek() == '_'):
-                    ident = self.parse_identifier()
-                    self.skip_whitespace()
-                    
-                    if self.peek() == '=':
-                        self.consume('=')
-                        value = self.parse_value()
-                        result[ident] = value
-                    else:
-                        self.pos = saved_pos
-                        value = self.parse_value()
-                        result[array_index] = value
-                        array_index += 1
-                else:
-                    value = self.parse_value()
-                    result[array_index] = value
-                    array_index += 1
+                result[array_index] = self.parse_value()
+                if array_index > max_key:
+                    max_key = array_index
+                array_index += 1
             
-            self.skip_whitespace()
-            if self.peek() == ',':
-                self.consume(',')
+            if tokens[self.index][0] == ',':
+                self.index += 1
         
-        if result and all(isinstance(k, int) for k in result.keys()):
-            max_idx = max(result.keys())
-            if set(result.keys()) == set(range(1, max_idx + 1)):
-                return [result[i] for i in range(1, max_idx + 1)]
+        # Keys 1..n with none missing: a Lua array
+        if result and dense and max_key == len(result):
+            return [result[i] for i in range(1, max_key + 1)]
         
         return result
     
     def parse_assignment(self):
-        self.skip_whitespace()
         name = self.parse_identifier()
-        self.skip_whitespace()
         self.consume('=')
         value = self.parse_value()
         return name, value
@@ -200,20 +203,51 @@ def parse_lua_file(filepath):
     """Read and parse Lua file"""
     with open(filepath, 'r', encoding='utf-8') as f:
         code = f.read()
-    
-    lines = []
-    for line in code.split('\n'):
-        stripped = line.strip()
-        if stripped.startswith('--'):
-            continue
-        lines.append(line)
-    
-    clean_code = '\n'.join(lines).strip()
+    return parse_lua_source(code)
+
+
+def _strip_comment_lines(code):
+    """Drop whole-line '--' comments, newline included, before parsing.
+    
+    Jumps between '--' occurrences with str.find (a C-level memchr-style
+    search) and only looks back to the start of the line for those.
+    """
+    pos = code.find('--')
+    if pos == -1:
+        return code
+    
+    parts = []
+    keep = 0
+    while pos != -1:
+        line_start = code.rfind('\n', 0, pos) + 1
+        line_end = code.find('\n', pos)
+        line_end = len(code) if line_end == -1 else line_end + 1
+        if line_start == pos or code[line_start:pos].isspace():
+            parts.append(code[keep:line_start])
+            keep = line_end
+        pos = code.find('--', line_end)
+    parts.append(code[keep:])
+    return ''.join(parts)
+
+
+def parse_lua_source(code):
+    """Parse Lua source text (with '\\n' line endings)"""
+    clean_code = _strip_comment_lines(code).strip()
     
     parser = LuaParser(clean_code)
     return parser.parse_assignment()
 
 
+# Lua 5.1 chunk header: signature, version, format, little endian,
+# sizeof int/size_t/Instruction/lua_Number, floating-point numbers
+LUA_HEADER = b'\x1bLua\x51\x00\x01\x04\x04\x04\x08\x00'
+FUNCTION_HEADER = struct.Struct('<IiiBBBB')
+FUNCTION_FOOTER = struct.Struct('<iiii')
+INT = struct.Struct('<i')
+NUMBER_CONST = struct.Struct('<Bd')
+STRING_CONST = struct.Struct('<BI')
+
+
 class LuaCompiler:
     """Compile Lua table to Bytecode 5.1"""
     
@@ -229,66 +263,49 @@ class LuaCompiler:
     def __init__(self):
         self.output = bytearray()
         self.constants = []
-        self.const_map = {}
-        self.instructions = []
+        # Constant index per value, one map per Lua type
+        self._str_map = {}
+        self._num_map = {}
+        self._bool_map = {}
+        self._nil_idx = -1
+        self.instructions = array('I')  # encoded 32-bit instruction words
         self.max_stack = 2
     
-    def write_byte(self, b):
-        self.output.append(b & 0xFF)
-    
-    def write_int(self, val):
-        self.output.extend(struct.pack('<i', val))
-    
-    def write_size_t(self, val):
-        self.output.extend(struct.pack('<I', val))
-    
-    def write_number(self, val):
-        self.output.extend(struct.pack('<d', float(val)))
-    
-    def write_string(self, s):
-        if s is None:
-            self.write_size_t(0)
-        else:
-            encoded = s.encode('latin-1', errors='replace') + b'\x00'
-            self.write_size_t(len(encoded))
-            self.output.extend(encoded)
-    
-    def write_instruction(self, opcode, a=0, b=0, c=0, bx=None):
-        if bx is not None:
-            inst = (opcode & 0x3F) | ((a & 0xFF) << 6) | ((bx & 0x3FFFF) << 14)
-        else:
-            inst = (opcode & 0x3F) | ((a & 0xFF) << 6) | ((c & 0x1FF) << 14) | ((b & 0x1FF) << 23)
-        self.output.extend(struct.pack('<I', inst))
-    
-    def write_header(self):
-        self.output.extend(b'\x1bLua')
-        self.write_byte(0x51)
-        self.write_byte(0x00)
-        self.write_byte(0x01)
-        self.write_byte(0x04)
-        self.write_byte(0x04)
-        self.write_byte(0x04)
-        self.write_byte(0x08)
-        self.write_byte(0x00)
-    
     def add_constant(self, val):
-        if isinstance(val, int) and not isinstance(val, bool):
+        if val is None:
+            if self._nil_idx < 0:
+                self._nil_idx = self._append_constant(None)
+            return self._nil_idx
+        
+        t = type(val)
+        if t is str:
+            const_map, key = self._str_map, val
+        elif t is bool:
+            const_map, key = self._bool_map, val
+        else:
             val = float(val)
+            # 0.0 == -0.0 and nan != nan, but both must stay as written
+            key = repr(val) if val == 0.0 or val != val else val
+            const_map = self._num_map
         
-        key = (type(val).__name__, str(val))
-        if key in self.const_map:
-            return self.const_map[key]
-        
-        idx = len(self.constants)
-        self.constants.append(val)
-        self.const_map[key] = idx
+        idx = const_map.get(key)
+        if idx is None:
+            idx = const_map[key] = self._append_constant(val)
         return idx
     
+    def _append_constant(self, val):
+        self.constants.append(val)
+        return len(self.constants) - 1
+    
     def rk(self, idx):
         return idx + 256 if idx < 256 else idx
     
     def emit(self, opcode, a=0, b=0, c=0, bx=None):
-        self.instructions.append((opcode, a, b, c, bx))
+        if bx is not None:
+            inst = (opcode & 0x3F) | ((a & 0xFF) << 6) | ((bx & 0x3FFFF) << 14)
+        else:
+            inst = (opcode & 0x3F) | ((a & 0xFF) << 6) | ((c & 0x1FF) << 14) | ((b & 0x1FF) << 23)
+        self.instructions.append(inst)
         if a + 1 > self.max_stack:
             self.max_stack = a + 1
     
@@ -316,11 +333,14 @@ class LuaCompiler:
         if not lst:
             return reg
         
-        for i, item in enumerate(lst):
-            item_reg = reg + 1 + i
-            self.compile_value(item, item_reg)
-            if item_reg + 1 > self.max_stack:
-                self.max_stack = item_reg + 2
+        # Items go in registers reg+1 .. reg+len(lst); reserve them once
+        top = reg + len(lst) + 2
+        if top > self.max_stack:
+            self.max_stack = top
+        
+        compile_value = self.compile_value
+        for item_reg, item in enumerate(lst, reg + 1):
+            compile_value(item, item_reg)
         
         self.emit(self.OP_SETLIST, reg, len(lst), 1)
         return reg
@@ -332,6 +352,7 @@ class LuaCompiler:
             hash_log += 1
         
         self.emit(self.OP_NEWTABLE, reg, 0, hash_log)
+        nested = False
         
         for key, val in dct.items():
             key_idx = self.rk(self.add_constant(key))
@@ -339,8 +360,7 @@ class LuaCompiler:
             if isinstance(val, (list, dict)):
                 val_reg = reg + 1
                 self.compile_value(val, val_reg)
-                if val_reg + 1 > self.max_stack:
-                    self.max_stack = val_reg + 2
+                nested = True
                 self.emit(self.OP_SETTABLE, reg, key_idx, val_reg)
             elif val is None:
                 val_reg = reg + 1
@@ -353,6 +373,10 @@ class LuaCompiler:
                 val_idx = self.rk(self.add_constant(val))
                 self.emit(self.OP_SETTABLE, reg, key_idx, val_idx)
         
+        # Nested tables are built in reg+1; reserve it (plus one) once
+        if nested and reg + 3 > self.max_stack:
+            self.max_stack = reg + 3
+        
         return reg
     
     def compile_table(self, global_name, table):
@@ -362,41 +386,68 @@ class LuaCompiler:
         self.emit(self.OP_RETURN, 0, 1)
     
     def build_bytecode(self):
-        self.output = bytearray()
-        self.write_header()
-        
-        self.write_string(None)
-        self.write_int(0)
-        self.write_int(0)
-        self.write_byte(0)
-        self.write_byte(0)
-        self.write_byte(2)
-        self.write_byte(self.max_stack + 10)
-        
-        self.write_int(len(self.instructions))
-        for opcode, a, b, c, bx in self.instructions:
-            self.write_instruction(opcode, a, b, c, bx=bx)
-        
-        self.write_int(len(self.constants))
+        words = self.instructions
+        if sys.byteorder != 'little':
+            words = array('I', words)
+            words.byteswap()
+        
+        # Strings are encoded up front so the exact output size is known
+        strings = {}
+        consts_size = 0
+        for const in self.constants:
+            if const is None:
+                consts_size += 1
+            elif isinstance(const, bool):
+                consts_size += 2
+            elif isinstance(const, float):
+                consts_size += 9
+            elif isinstance(const, str):
+                encoded = strings[const] = const.encode('latin-1', errors='replace') + b'\x00'
+                consts_size += 5 + len(encoded)
+        
+        size = (len(LUA_HEADER) + FUNCTION_HEADER.size + 4 + 4 * len(words)
+                + 4 + consts_size + FUNCTION_FOOTER.size)
+        out = self.output = bytearray(size)
+        
+        out[:len(LUA_HEADER)] = LUA_HEADER
+        pos = len(LUA_HEADER)
+        # source name (none), line defined, last line, upvalues, params, vararg, max stack
+        FUNCTION_HEADER.pack_into(out, pos, 0, 0, 0, 0, 0, 2, (self.max_stack + 10) & 0xFF)
+        pos += FUNCTION_HEADER.size
+        
+        INT.pack_into(out, pos, len(words))
+        pos += 4
+        out[pos:pos + 4 * len(words)] = words.tobytes()
+        pos += 4 * len(words)
+        
+        INT.pack_into(out, pos, len(self.constants))
+        pos += 4
         for const in self.constants:
             if const is None:
-                self.write_byte(0)
+                out[pos] = 0
+                pos += 1
             elif isinstance(const, bool):
-                self.write_byte(1)
-                self.write_byte(1 if const else 0)
+                out[pos] = 1
+                out[pos + 1] = 1 if const else 0
+                pos += 2
             elif isinstance(const, float):
-                self.write_byte(3)
-                self.write_number(const)
+                NUMBER_CONST.pack_into(out, pos, 3, const)
+                pos += 9
             elif isinstance(const, str):
-                self.write_byte(4)
-                self.write_string(const)
+                encoded = strings[const]
+                STRING_CONST.pack_into(out, pos, 4, len(encoded))
+                pos += 5
+                out[pos:pos + len(encoded)] = encoded
+                pos += len(encoded)
         
-        self.write_int(0)
-        self.write_int(0)
-        self.write_int(0)
-        self.write_int(0)
+        # no prototypes, line info, locals or upvalues
+        FUNCTION_FOOTER.pack_into(out, pos, 0, 0, 0, 0)
         
-        return bytes(self.output)
+        return bytes(out)
+
+
+# Characters escaped when writing string literals back out
+_STRING_ESCAPES = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': '\\n', '\r': '\\r', '\t': '\\t'})
 
 
 class LuaDecompiler:
@@ -446,11 +497,13 @@ class LuaDecompiler:
         self.read_byte()
         self.read_byte()
         
+        # The instruction block is read as one array of 32-bit words
         num_inst = self.read_int()
-        instructions = []
-        for _ in range(num_inst):
-            instructions.append(struct.unpack('<I', self.data[self.pos:self.pos+4])[0])
-            self.pos += 4
+        instructions = array('I')
+        instructions.frombytes(self.data[self.pos:self.pos + 4 * num_inst])
+        if sys.byteorder != 'little':
+            instructions.byteswap()
+        self.pos += 4 * num_inst
         
         num_const = self.read_int()
         constants = []
@@ -485,8 +538,44 @@ class LuaDecompiler:
         return instructions, constants
     
     def format_value(self, val, indent=0):
-        prefix = "    " * indent
-        
+        out = []
+        self._emit(val, indent, out.append)
+        return "".join(out)
+    
+    def _emit(self, val, indent, write):
+        """Pass the Lua text for val to write, fragment by fragment"""
+        if isinstance(val, dict):
+            if not val:
+                write("{}")
+                return
+            prefix = "    " * indent
+            write("{")
+            for k, v in val.items():
+                if isinstance(k, str) and k.isidentifier() and not k[0].isdigit():
+                    write(f"\n{prefix}    {k} = ")
+                else:
+                    write(f"\n{prefix}    [{self._format_scalar(k)}] = ")
+                self._emit(v, indent + 1, write)
+                write(",")
+            write(f"\n{prefix}}}")
+        elif isinstance(val, list):
+            if not val:
+                write("{}")
+                return
+            if all(isinstance(x, (int, float, str, bool, type(None))) for x in val):
+                write("{ " + ", ".join(map(self._format_scalar, val)) + " }")
+                return
+            prefix = "    " * indent
+            write("{")
+            for item in val:
+                write(f"\n{prefix}    ")
+                self._emit(item, indent + 1, write)
+                write(",")
+            write(f"\n{prefix}}}")
+        else:
+            write(self._format_scalar(val))
+    
+    def _format_scalar(self, val):
         if val is None:
             return "nil"
         elif isinstance(val, bool):
@@ -496,74 +585,76 @@ class LuaDecompiler:
                 return str(int(val))
             return str(val)
         elif isinstance(val, str):
-            escaped = val.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+            escaped = val.translate(_STRING_ESCAPES)
             return f'"{escaped}"'
-        elif isinstance(val, dict):
-            if not val:
-                return "{}"
-            lines = ["{"]
-            for k, v in val.items():
-                fv = self.format_value(v, indent + 1)
-                if isinstance(k, str) and k.isidentifier() and not k[0].isdigit():
-                    lines.append(f"{prefix}    {k} = {fv},")
-                else:
-                    lines.append(f"{prefix}    [{self.format_value(k)}] = {fv},")
-            lines.append(f"{prefix}}}")
-            return "\n".join(lines)
-        elif isinstance(val, list):
-            if not val:
-                return "{}"
-            if all(isinstance(x, (int, float, str, bool, type(None))) for x in val):
-                return "{ " + ", ".join(self.format_value(x) for x in val) + " }"
-            lines = ["{"]
-            for item in val:
-                lines.append(f"{prefix}    {self.format_value(item, indent + 1)},")
-            lines.append(f"{prefix}}}")
-            return "\n".join(lines)
         return str(val)
     
     def reconstruct_table(self, instructions, constants):
         registers = {}
         global_name = None
+        num_const = len(constants)
         
-        def get_const(idx):
-            idx = idx - 256 if idx >= 256 else idx
-            return constants[idx] if 0 <= idx < len(constants) else None
-        
+        # Opcodes are tested most frequent first, and each one only decodes
+        # the operand fields it uses. Constant lookups are inlined: an index
+        # of 256 or more is an RK constant reference, anything out of range is nil.
         for inst in instructions:
             opcode = inst & 0x3F
-            a = (inst >> 6) & 0xFF
-            b = (inst >> 23) & 0x1FF
-            c = (inst >> 14) & 0x1FF
-            bx = (inst >> 14) & 0x3FFFF
             
-            if opcode == 10:
-                registers[a] = {}
-            elif opcode == 9:
-                if a in registers and isinstance(registers[a], dict):
-                    key = get_const(b) if b >= 256 else registers.get(b)
-                    val = get_const(c) if c >= 256 else registers.get(c)
+            if opcode == 9:  # SETTABLE
+                a = (inst >> 6) & 0xFF
+                table = registers.get(a)
+                if isinstance(table, dict):
+                    b = inst >> 23
+                    if b >= 256:
+                        key = constants[b - 256] if b - 256 < num_const else None
+                    else:
+                        key = registers.get(b)
                     if key is not None:
-                        registers[a][key] = val
-            elif opcode == 1:
-                registers[a] = get_const(bx)
-            elif opcode == 34:
+                        c = (inst >> 14) & 0x1FF
+                        if c >= 256:
+                            table[key] = constants[c - 256] if c - 256 < num_const else None
+                        else:
+                            table[key] = registers.get(c)
+            elif opcode == 1:  # LOADK
+                bx = inst >> 14
+                if bx >= 256:
+                    bx -= 256
+                registers[(inst >> 6) & 0xFF] = constants[bx] if bx < num_const else None
+            elif opcode == 10:  # NEWTABLE
+                registers[(inst >> 6) & 0xFF] = {}
+            elif opcode == 34:  # SETLIST
+                a = (inst >> 6) & 0xFF
                 if a in registers:
+                    b = inst >> 23
                     items = [registers.get(a + i + 1) for i in range(b)]
                     registers[a] = [x for x in items if x is not None] or registers[a]
-            elif opcode == 7:
-                global_name = get_const(bx)
+            elif opcode == 7:  # SETGLOBAL
+                bx = inst >> 14
+                if bx >= 256:
+                    bx -= 256
+                global_name = constants[bx] if bx < num_const else None
         
         return global_name, registers.get(0, {})
     
-    def decompile(self):
+    def decompile(self, out=None):
+        """Decompile to Lua source.
+        
+        With no out, the source is returned as a string; otherwise it is
+        streamed to the text file out and nothing is returned.
+        """
         self.parse_header()
         instructions, constants = self.parse_function()
         global_name, table = self.reconstruct_table(instructions, constants)
         
-        if global_name:
-            return f"{global_name} = {self.format_value(table)}\n"
-        return f"return {self.format_value(table)}\n"
+        if out is None:
+            if global_name:
+                return f"{global_name} = {self.format_value(table)}\n"
+            return f"return {self.format_value(table)}\n"
+        
+        write = out.write
+        write(f"{global_name} = " if global_name else "return ")
+        self._emit(table, 0, write)
+        write("\n")
 
 
 def compile_lua_file(input_path, output_path=None):
@@ -604,118 +695,142 @@ def decompile_file(input_path, output_path=None):
         return False
     
     decompiler = LuaDecompiler(data)
-    lua_code = decompiler.decompile()
     
     if output_path is None:
         output_path = input_path.rsplit('.', 1)[0] + '_decompiled.lua'
     
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("-- Decompiled from Shank 2 Lua bytecode\n")
-        f.write(f"-- Original file: {os.path.basename(input_path)}\n\n")
-        f.write(lua_code)
+    _write_decompiled(decompiler, output_path,
+                      "-- Decompiled from Shank 2 Lua bytecode\n"
+                      f"-- Original file: {os.path.basename(input_path)}\n\n")
     
     print(f"Decompiled: {input_path}")
     print(f"  Output: {output_path}")
     return True
 
 
-def batch_decompile(folder_path, output_folder=None):
+def _write_decompiled(decompiler, output_path, header):
+    """Stream decompiled source to output_path, removing it if decompiling fails"""
+    try:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(header)
+            decompiler.decompile(f)
+    except Exception:
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+
+
+def _decompile_one(filepath, output_folder):
+    """Decompile one file for batch_decompile; returns (status, message)"""
+    filename = os.path.basename(filepath)
+    try:
+        # One open per file: sniff the magic, read the rest only for bytecode
+        with open(filepath, 'rb') as f:
+            header = f.read(4)
+            if header != b'\x1bLua':
+                return 'skipped', None
+            data = header + f.read()
+        
+        out_name = os.path.splitext(filename)[0] + '_decompiled.lua'
+        out_path = os.path.join(output_folder, out_name)
+        
+        decompiler = LuaDecompiler(data)
+        _write_decompiled(decompiler, out_path, f"-- Decompiled from: {filename}\n\n")
+        
+        return 'success', f"[OK] {filename}"
+    
+    except Exception as e:
+        return 'failed', f"[FAIL] {filename}: {e}"
+
+
+def _compile_one(filepath, output_folder):
+    """Compile one file for batch_compile; returns (status, message)"""
+    filename = os.path.basename(filepath)
+    try:
+        with open(filepath, 'rb') as f:
+            data = f.read()
+        
+        if data[:4] == b'\x1bLua':
+            return 'skipped', None
+        
+        # Same text as parse_lua_file's open(): UTF-8, universal newlines
+        code = data.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+        global_name, table = parse_lua_source(code)
+        
+        compiler = LuaCompiler()
+        compiler.compile_table(global_name, table)
+        bytecode = compiler.build_bytecode()
+        
+        out_name = filename.replace('_decompiled', '')
+        out_path = os.path.join(output_folder, out_name)
+        
+        with open(out_path, 'wb') as f:
+            f.write(bytecode)
+        
+        return 'success', f"[OK] {filename} -> {out_name}"
+    
+    except Exception as e:
+        return 'failed', f"[FAIL] {filename}: {e}"
+
+
+def _run_batch(worker, paths, output_folder, workers=None):
+    """Run worker over paths, in a process pool when there is more than one
+    file and CPU; prints each message in order and returns the status counts"""
+    counts = {'success': 0, 'failed': 0, 'skipped': 0}
+    workers = workers or os.cpu_count() or 1
+    folders = [output_folder] * len(paths)
+    
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+            for status, message in executor.map(worker, paths, folders, chunksize=8):
+                counts[status] += 1
+                if message:
+                    print(message)
+    else:
+        for status, message in map(worker, paths, folders):
+            counts[status] += 1
+            if message:
+                print(message)
+    return counts
+
+
+def batch_decompile(folder_path, output_folder=None, workers=None):
     """Decompile all bytecode files in folder"""
     if output_folder is None:
         output_folder = os.path.join(folder_path, "decompiled")
     
     os.makedirs(output_folder, exist_ok=True)
     
-    success = 0
-    failed = 0
-    skipped = 0
-    
     files = [f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))]
     
     print(f"Scanning {len(files)} files...")
     print("=" * 50)
     
-    for filename in files:
-        filepath = os.path.join(folder_path, filename)
-        
-        try:
-            with open(filepath, 'rb') as f:
-                header = f.read(4)
-            
-            if header == b'\x1bLua':
-                out_name = os.path.splitext(filename)[0] + '_decompiled.lua'
-                out_path = os.path.join(output_folder, out_name)
-                
-                with open(filepath, 'rb') as f:
-                    data = f.read()
-                
-                decompiler = LuaDecompiler(data)
-                lua_code = decompiler.decompile()
-                
-                with open(out_path, 'w', encoding='utf-8') as f:
-                    f.write(f"-- Decompiled from: {filename}\n\n")
-                    f.write(lua_code)
-                
-                print(f"[OK] {filename}")
-                success += 1
-            else:
-                skipped += 1
-        
-        except Exception as e:
-            print(f"[FAIL] {filename}: {e}")
-            failed += 1
+    paths = [os.path.join(folder_path, f) for f in files]
+    counts = _run_batch(_decompile_one, paths, output_folder, workers)
     
     print("=" * 50)
-    print(f"Done! Success: {success}, Failed: {failed}, Skipped: {skipped}")
+    print(f"Done! Success: {counts['success']}, Failed: {counts['failed']}, Skipped: {counts['skipped']}")
     print(f"Output: {output_folder}")
 
 
-def batch_compile(folder_path, output_folder=None):
+def batch_compile(folder_path, output_folder=None, workers=None):
     """Compile all Lua files in folder"""
     if output_folder is None:
         output_folder = os.path.join(folder_path, "compiled")
     
     os.makedirs(output_folder, exist_ok=True)
     
-    success = 0
-    failed = 0
-    
     files = [f for f in os.listdir(folder_path) if f.endswith('.lua')]
     
     print(f"Compiling {len(files)} files...")
     print("=" * 50)
     
-    for filename in files:
-        filepath = os.path.join(folder_path, filename)
-        
-        try:
-            with open(filepath, 'rb') as f:
-                header = f.read(4)
-            
-            if header == b'\x1bLua':
-                continue
-            
-            global_name, table = parse_lua_file(filepath)
-            
-            compiler = LuaCompiler()
-            compiler.compile_table(global_name, table)
-            bytecode = compiler.build_bytecode()
-            
-            out_name = filename.replace('_decompiled', '')
-            out_path = os.path.join(output_folder, out_name)
-            
-            with open(out_path, 'wb') as f:
-                f.write(bytecode)
-            
-            print(f"[OK] {filename} -> {out_name}")
-            success += 1
-        
-        except Exception as e:
-            print(f"[FAIL] {filename}: {e}")
-            failed += 1
+    paths = [os.path.join(folder_path, f) for f in files]
+    counts = _run_batch(_compile_one, paths, output_folder, workers)
     
     print("=" * 50)
-    print(f"Done! Success: {success}, Failed: {failed}")
+    print(f"Done! Success: {counts['success']}, Failed: {counts['failed']}")
     print(f"Output: {output_folder}")
 
 
@@ -765,4 +880,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # batch workers in frozen (PyInstaller) builds
     main()
\ No newline at end of file
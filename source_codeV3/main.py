@@ -7,11 +7,16 @@ TEX/PNG Converter + Lua Decompiler/Compiler + Advanced Plugins
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 from pathlib import Path
+from collections import OrderedDict
 import threading
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import importlib.util
+import functools
+import math
 import sys
 import os
-import ctypes
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
@@ -31,38 +36,82 @@ except:
     def decompile_file(*args): return False
     def compile_lua_file(*args): return False
 
-# تحميل PIL للصور
-try:
-    from PIL import Image, ImageTk, ImageEnhance
-    PIL_AVAILABLE = True
-except ImportError:
-    PIL_AVAILABLE = False
+# تحميل PIL للصور - only imported once a background image is actually used
+Image = ImageTk = ImageEnhance = None
+PIL_AVAILABLE = importlib.util.find_spec("PIL") is not None
+np = None
+NUMPY_AVAILABLE = False
+
+
+def load_pil():
+    """Import PIL (and NumPy, if installed) on first use; returns whether PIL is available"""
+    global Image, ImageTk, ImageEnhance, PIL_AVAILABLE, np, NUMPY_AVAILABLE
+    if PIL_AVAILABLE and Image is None:
+        try:
+            from PIL import Image, ImageTk, ImageEnhance
+        except ImportError:
+            PIL_AVAILABLE = False
+        try:
+            import numpy as np
+            NUMPY_AVAILABLE = True
+        except ImportError:
+            NUMPY_AVAILABLE = False
+    return PIL_AVAILABLE
+
+
+# تحميل نظام الإضافات المتقدم - imported by the first PluginManager
+ADVANCED_PLUGINS = None
+
+
+def load_plugin_system():
+    """Import the @tool plugin system on first use; returns whether it is available"""
+    global tool, AdvancedPluginLoader, ToolWindow, ADVANCED_PLUGINS
+    if ADVANCED_PLUGINS is None:
+        try:
+            from plugin_system import tool, AdvancedPluginLoader
+            from auto_ui_builder import ToolWindow
+            ADVANCED_PLUGINS = True
+        except ImportError:
+            ADVANCED_PLUGINS = False
+            print("Note: Advanced plugin system not available")
+    return ADVANCED_PLUGINS
+
+
+@functools.lru_cache(maxsize=64)
+def hex_to_rgb(hex_color):
+    """Parse "#rrggbb" into an (r, g, b) tuple"""
+    v = int(hex_color.lstrip('#'), 16)
+    return ((v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF)
 
-# تحميل نظام الإضافات المتقدم
-try:
-    from plugin_system import tool, AdvancedPluginLoader
-    from auto_ui_builder import ToolWindow
-    ADVANCED_PLUGINS = True
-except ImportError:
-    ADVANCED_PLUGINS = False
-    print("Note: Advanced plugin system not available")
+
+# Last (color, dark mode) sent to DWM per window id
+_last_titlebar = {}
 
 
 def set_title_bar_color(window, color):
-    """Change title bar color on Windows 10/11"""
+    """Change title bar color on Windows 10/11; color is "#rrggbb" or an (r, g, b) tuple"""
     if sys.platform != "win32":
         return False
     
     try:
+        import ctypes
+        
         if isinstance(color, str):
-            color = color.lstrip('#')
-            r, g, b = tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
+            r, g, b = hex_to_rgb(color)
         else:
             r, g, b = color
         
         color_value = r | (g << 8) | (b << 16)
+        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
+        dark = 1 if luminance < 0.5 else 0
+        
+        # Each DWM call is a round trip to dwm.exe; skip repeats
+        window_id = window.winfo_id()
+        if _last_titlebar.get(window_id) == (color_value, dark):
+            return True
+        
         window.update()
-        hwnd = ctypes.windll.user32.GetParent(window.winfo_id())
+        hwnd = ctypes.windll.user32.GetParent(window_id)
         
         DWMWA_CAPTION_COLOR = 35
         DWMWA_USE_IMMERSIVE_DARK_MODE = 20
@@ -72,10 +121,10 @@ def set_title_bar_color(window, color):
         dwmapi.DwmSetWindowAttribute(hwnd, DWMWA_CAPTION_COLOR, 
                                       ctypes.byref(color_ref), ctypes.sizeof(color_ref))
         
-        luminance = (0.299 * r + 0.587 * g + 0.114 * b) / 255
-        dark_mode = ctypes.c_int(1 if luminance < 0.5 else 0)
+        dark_mode = ctypes.c_int(dark)
         dwmapi.DwmSetWindowAttribute(hwnd, DWMWA_USE_IMMERSIVE_DARK_MODE,
                                       ctypes.byref(dark_mode), ctypes.sizeof(dark_mode))
+        _last_titlebar[window_id] = (color_value, dark)
         return True
     except:
         return False
@@ -84,18 +133,138 @@ def set_title_bar_color(window, color):
 def get_average_color(image):
     """Get average color from an image"""
     try:
-        small = image.resize((50, 50))
-        pixels = list(small.getdata())
-        if len(pixels[0]) >= 3:
-            avg_r = sum(p[0] for p in pixels) // len(pixels)
-            avg_g = sum(p[1] for p in pixels) // len(pixels)
-            avg_b = sum(p[2] for p in pixels) // len(pixels)
-            return (avg_r, avg_g, avg_b)
+        # A BOX resize to 1x1 is an exact area average, done in PIL's C code
+        pixel = image.convert('RGB').resize((1, 1), Image.Resampling.BOX)
+        return pixel.getpixel((0, 0))
     except:
         pass
     return None
 
 
+def list_files(folder_path, suffix, ignore_case=False):
+    """Files in folder_path whose names end with suffix, as os.DirEntry objects"""
+    with os.scandir(folder_path) as entries:
+        if ignore_case:
+            return [e for e in entries if e.name.lower().endswith(suffix) and e.is_file()]
+        return [e for e in entries if e.name.endswith(suffix) and e.is_file()]
+
+
+def _swap_ext(path, new_suffix):
+    """Replace everything from the last dot in path with new_suffix"""
+    dot = path.rfind('.')
+    return (path[:dot] if dot != -1 else path) + new_suffix
+
+
+DECOMPILED_SUFFIX = '_decompiled.lua'
+
+
+def _strip_decompiled(filename):
+    """Turn name_decompiled.lua back into name.lua; other names are unchanged"""
+    if filename.endswith(DECOMPILED_SUFFIX):
+        return filename[:-len(DECOMPILED_SUFFIX)] + '.lua'
+    return filename
+
+
+def _will_need(path):
+    """Ask the OS to start reading path into the page cache"""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def prefetch_files(files):
+    """Yield files in order, asking the OS to read each one ahead of its turn.
+    
+    Without posix_fadvise (Windows) the files are passed through as is.
+    """
+    if not hasattr(os, 'posix_fadvise'):
+        yield from files
+        return
+    
+    files = list(files)
+    if files:
+        _will_need(files[0])
+    for i, path in enumerate(files):
+        if i + 1 < len(files):
+            _will_need(files[i + 1])
+        yield path
+
+
+LUA_MAGIC = b'\x1bLua'
+_PROBE_FLAGS = os.O_RDONLY | getattr(os, 'O_BINARY', 0)
+
+
+def is_lua_bytecode(filepath, will_read=False):
+    """Check for the bytecode magic with one unbuffered 4-byte read.
+    
+    With will_read the OS is also asked to read the rest of the file
+    ahead, since the caller is about to open it again.
+    """
+    try:
+        # O_NOATIME skips the access-time update; only allowed on files we own
+        fd = os.open(filepath, _PROBE_FLAGS | getattr(os, 'O_NOATIME', 0))
+    except PermissionError:
+        fd = os.open(filepath, _PROBE_FLAGS)
+    try:
+        if will_read and hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+        return os.read(fd, 4) == LUA_MAGIC
+    finally:
+        os.close(fd)
+
+
+def _decompile_worker(filepath, out_path):
+    """Decompile one file for a folder batch; returns (ok, log line or None)"""
+    filename = os.path.basename(filepath)
+    try:
+        if not is_lua_bytecode(filepath, will_read=True):
+            return False, None
+        if decompile_file(filepath, out_path):
+            return True, f"[OK] {filename}"
+    except Exception as e:
+        return False, f"[ERROR] {filename}: {e}"
+    return False, None
+
+
+def _compile_worker(filepath, out_path):
+    """Compile one file for a folder batch; returns (ok, log line or None)"""
+    filename = os.path.basename(filepath)
+    try:
+        if is_lua_bytecode(filepath, will_read=True):
+            return False, None
+        if compile_lua_file(filepath, out_path):
+            return True, f"[OK] {filename}"
+    except Exception as e:
+        return False, f"[ERROR] {filename}: {e}"
+    return False, None
+
+
+def iter_parallel(worker, jobs):
+    """Run worker(*job) for every job and yield the results as they finish.
+    
+    Jobs go to a process pool when there is more than one job and CPU,
+    so the worker must be a module-level function.
+    """
+    workers = min(os.cpu_count() or 1, len(jobs))
+    if workers <= 1:
+        for job in jobs:
+            yield worker(*job)
+        return
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(worker, *job) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+
+
 class ThemeManager:
     """Theme Manager - Purple Theme"""
     THEME = {
@@ -113,10 +282,15 @@ class ThemeManager:
         "progress_bg": "#2d1448",
         "progress_fg": "#bf5af2"
     }
+    THEME_RGB = {k: hex_to_rgb(v) for k, v in THEME.items() if v.startswith("#")}
     
     @classmethod
     def get_theme(cls):
         return cls.THEME
+    
+    @classmethod
+    def get_rgb(cls, key):
+        return cls.THEME_RGB[key]
 
 
 class FlashEffect:
@@ -126,25 +300,35 @@ class FlashEffect:
         self.app = app
         self.is_flashing = False
         self.flash_step = 0
-        self.total_steps = 20
+        self.total_steps = 10
         self.original_bg = None
         self.original_frame_bg = None
         self.flash_type = "success"
+        self._intensities = []
+        self._bg_table = []
+        self._frame_table = []
+        self._base_image = None
+        self._base_arr = None
+        self._last_intensity = -1.0
+        self._last_colors = None
+        self._bg_widgets = None
+        self._frame_widgets = None
+        self._flash_photo = None
     
-    def hex_to_rgb(self, hex_color):
-        hex_color = hex_color.lstrip('#')
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+    hex_to_rgb = staticmethod(hex_to_rgb)
     
     def rgb_to_hex(self, rgb):
-        return "#{:02x}{:02x}{:02x}".format(
-            max(0, min(255, int(rgb[0]))),
-            max(0, min(255, int(rgb[1]))),
-            max(0, min(255, int(rgb[2])))
-        )
+        r = max(0, min(255, int(rgb[0])))
+        g = max(0, min(255, int(rgb[1])))
+        b = max(0, min(255, int(rgb[2])))
+        return "#%06x" % ((r << 16) | (g << 8) | b)
     
     def blend_colors(self, color1, color2, factor):
-        r1, g1, b1 = self.hex_to_rgb(color1)
-        r2, g2, b2 = self.hex_to_rgb(color2)
+        return self.blend_rgb(self.hex_to_rgb(color1), self.hex_to_rgb(color2), factor)
+    
+    def blend_rgb(self, rgb1, rgb2, factor):
+        r1, g1, b1 = rgb1
+        r2, g2, b2 = rgb2
         
         r = r1 + (r2 - r1) * factor
         g = g1 + (g2 - g1) * factor
@@ -164,36 +348,53 @@ class FlashEffect:
         self.original_bg = theme["bg"]
         self.original_frame_bg = theme["frame_bg"]
         
-        self._animate_flash()
-    
-    def _animate_flash(self):
-        if not self.is_flashing:
-            return
-        
-        theme = ThemeManager.get_theme()
-        
-        if self.flash_type == "success":
+        if flash_type == "success":
             flash_color = theme.get("flash_color", "#00ff88")
-        elif self.flash_type == "error":
+        elif flash_type == "error":
             flash_color = "#ff4444"
         else:
             flash_color = theme.get("warning", "#ffaa00")
         
-        import math
-        if self.flash_step < self.total_steps // 2:
-            progress = self.flash_step / (self.total_steps // 2)
-            intensity = math.sin(progress * math.pi / 2)
-        else:
-            progress = (self.flash_step - self.total_steps // 2) / (self.total_steps // 2)
-            intensity = math.cos(progress * math.pi / 2)
-        
-        current_bg = self.blend_colors(self.original_bg, flash_color, intensity * 0.4)
-        current_frame_bg = self.blend_colors(self.original_frame_bg, flash_color, intensity * 0.3)
+        self._build_tables(flash_color)
+        self._last_intensity = -1.0
+        self._last_colors = None
+        self._animate_flash()
+    
+    def _build_tables(self, flash_color):
+        """Precompute the intensity curve and blended colors for every step"""
+        half = self.total_steps // 2
+        self._intensities = []
+        for step in range(self.total_steps):
+            if step < half:
+                intensity = math.sin(step / half * math.pi / 2)
+            else:
+                intensity = math.cos((step - half) / half * math.pi / 2)
+            self._intensities.append(intensity)
+        
+        bg_rgb = ThemeManager.get_rgb("bg")
+        frame_rgb = ThemeManager.get_rgb("frame_bg")
+        flash_rgb = self.hex_to_rgb(flash_color)
+        self._bg_table = [self.blend_rgb(bg_rgb, flash_rgb, i * 0.4)
+                          for i in self._intensities]
+        self._frame_table = [self.blend_rgb(frame_rgb, flash_rgb, i * 0.3)
+                             for i in self._intensities]
+    
+    def _animate_flash(self):
+        if not self.is_flashing:
+            return
         
-        self._apply_flash_colors(current_bg, current_frame_bg)
+        intensity = self._intensities[self.flash_step]
+        colors = (self._bg_table[self.flash_step], self._frame_table[self.flash_step])
+        if colors != self._last_colors:
+            self._apply_flash_colors(*colors)
+            self._last_colors = colors
         
+        # Redrawing the background is the expensive part; skip imperceptible changes
         if self.app.bg_image and PIL_AVAILABLE:
-            self._flash_background_image(intensity)
+            edge = self.flash_step in (0, self.total_steps - 1)
+            if edge or abs(intensity - self._last_intensity) >= 0.05:
+                self._flash_background_image(intensity)
+                self._last_intensity = intensity
         
         self.flash_step += 1
         
@@ -205,33 +406,35 @@ class FlashEffect:
             if self.app.bg_image:
                 self.app.update_background()
     
+    def _cache_widgets(self):
+        """Collect the flashed widgets once; they only exist after setup_ui"""
+        app = self.app
+        self._bg_widgets = (
+            app.window, app.main_container, app.canvas, app.content_frame,
+            app.title_label, app.status, app.log_label
+        )
+        self._frame_widgets = (
+            app.tex_frame, app.lua_frame, app.plugins_frame,
+            app.tex_btn_frame1, app.tex_btn_frame2,
+            app.lua_btn_frame1, app.lua_btn_frame2,
+            app.plugins_header_frame, app.plugin_buttons_frame,
+            app.progress_frame, app.log_outer_frame,
+            app.plugins_info_label
+        )
+    
     def _apply_flash_colors(self, bg_color, frame_bg_color):
         try:
-            self.app.window.configure(bg=bg_color)
-            self.app.main_container.configure(bg=bg_color)
-            self.app.canvas.configure(bg=bg_color)
-            self.app.content_frame.configure(bg=bg_color)
+            if self._bg_widgets is None:
+                self._cache_widgets()
+            
+            for widget in self._bg_widgets:
+                widget.configure(bg=bg_color)
             
             if not self.app.bg_image:
                 self.app.bg_label.configure(bg=bg_color)
             
-            self.app.title_label.configure(bg=bg_color)
-            self.app.status.configure(bg=bg_color)
-            self.app.log_label.configure(bg=bg_color)
-            
-            for frame in [self.app.tex_frame, self.app.lua_frame, self.app.plugins_frame]:
-                frame.configure(bg=frame_bg_color)
-            
-            inner_frames = [
-                self.app.tex_btn_frame1, self.app.tex_btn_frame2,
-                self.app.lua_btn_frame1, self.app.lua_btn_frame2,
-                self.app.plugins_header_frame, self.app.plugin_buttons_frame,
-                self.app.progress_frame, self.app.log_outer_frame
-            ]
-            for frame in inner_frames:
-                frame.configure(bg=frame_bg_color)
-            
-            self.app.plugins_info_label.configure(bg=frame_bg_color)
+            for widget in self._frame_widgets:
+                widget.configure(bg=frame_bg_color)
         except:
             pass
     
@@ -244,7 +447,11 @@ class FlashEffect:
             height = self.app.window.winfo_height()
             
             if width > 1 and height > 1:
-                resized = self.app.bg_image.resize((width, height), Image.Resampling.LANCZOS)
+                resized = self.app.resized_background(width, height)
+                
+                if NUMPY_AVAILABLE:
+                    self._show_flash_frame(self._brighten_array(resized, intensity))
+                    return
                 
                 enhancer = ImageEnhance.Brightness(resized)
                 brightened = enhancer.enhance(1.0 + intensity * 0.5)
@@ -260,10 +467,90 @@ class FlashEffect:
                     enhancer = ImageEnhance.Brightness(brightened)
                     brightened = enhancer.enhance(1.0 + intensity * 0.3)
                 
-                self.app.bg_photo = ImageTk.PhotoImage(brightened)
-                self.app.bg_label.configure(image=self.app.bg_photo)
+                self._show_flash_frame(brightened)
         except:
             pass
+    
+    def _show_flash_frame(self, image):
+        """Paste a frame into one reused PhotoImage instead of allocating one per frame"""
+        photo = self._flash_photo
+        if photo is None or (photo.width(), photo.height()) != image.size:
+            photo = self._flash_photo = ImageTk.PhotoImage(image)
+        else:
+            photo.paste(image)
+        
+        if self.app.bg_photo is not photo:
+            self.app.bg_photo = photo
+            self.app.bg_label.configure(image=photo)
+    
+    def _brighten_array(self, resized, intensity):
+        """Green boost and brightness in one NumPy pass over the resized background"""
+        if resized is not self._base_image:
+            self._base_image = resized
+            if resized.mode not in ("RGB", "RGBA"):
+                resized = resized.convert("RGBA")
+            self._base_arr = np.asarray(resized)
+        arr = self._base_arr
+        
+        rgb = arr[..., :3].astype(np.float32)
+        if self.flash_type == "success":
+            rgb[..., 1] = np.minimum(rgb[..., 1] + int(intensity * 50), 255)
+            rgb *= 1.0 + intensity * 0.3
+        else:
+            rgb *= 1.0 + intensity * 0.5
+        
+        out = np.empty_like(arr)
+        np.clip(rgb, 0, 255, out=rgb)
+        out[..., :3] = rgb
+        if arr.shape[2] == 4:
+            out[..., 3] = arr[..., 3]
+        return Image.fromarray(out)
+
+
+class BatchProgress:
+    """Collects log lines and progress on a batch worker thread and hands
+    them to the UI thread in batches instead of once per file"""
+    
+    FLUSH_FILES = 32
+    FLUSH_SECONDS = 0.05
+    
+    def __init__(self, app, total):
+        self.app = app
+        self.total = total
+        self.done = 0
+        self.step = 100.0 / total if total else 0.0
+        self.percent = 0.0
+        self.lines = []
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+    
+    def log(self, msg):
+        self.lines.append(msg + "\n")
+    
+    def advance(self):
+        self.done += 1
+        self.percent += self.step
+        self._unflushed += 1
+        now = time.monotonic()
+        if self.done == self.total:
+            # Summed steps can land a hair under 100
+            self.percent = 100.0
+        elif self._unflushed < self.FLUSH_FILES and now - self._last_flush <= self.FLUSH_SECONDS:
+            return
+        self._flush(now)
+    
+    def _flush(self, now):
+        text = "".join(self.lines)
+        self.lines = []
+        self._unflushed = 0
+        self._last_flush = now
+        self.app.window.after(0, self.app._flush_log, text, self.percent)
+    
+    def finish(self, status_text, success, message):
+        """Report the batch result on the UI thread, after any unshown lines"""
+        if self.lines or self._unflushed:
+            self._flush(time.monotonic())
+        self.app.window.after(0, self.app._finish_batch, status_text, success, message)
 
 
 class PluginManager:
@@ -275,9 +562,11 @@ class PluginManager:
         self.plugin_buttons = []
         self.plugins_folder = Path("plugins")
         self.plugins_folder.mkdir(exist_ok=True)
+        self._plugin_cache = {}  # path -> (mtime_ns, plugin or None)
+        self._total_count = 0
         
         # Advanced plugin system
-        if ADVANCED_PLUGINS:
+        if load_plugin_system():
             self.advanced_loader = AdvancedPluginLoader(str(self.plugins_folder))
             self.advanced_tools = []
         else:
@@ -318,6 +607,9 @@ Advanced Plugin Example - Using @tool decorator
 from plugin_system import tool
 import os
 
+# Characters str.splitlines() treats as line ends
+LINE_BREAKS = "\\n\\r\\v\\f\\x1c\\x1d\\x1e\\x85\\u2028\\u2029"
+
 @tool(
     name="Text Counter",
     description="Counts characters and words in a text file",
@@ -329,12 +621,20 @@ def count_text(input_file: str, count_spaces: bool = True):
     if not os.path.exists(input_file):
         return f"File not found: {input_file}"
     
+    # Stream the file in chunks so large files are never held in memory
+    chars = words = breaks = 0
+    in_word = False
+    last = ""
     with open(input_file, 'r', encoding='utf-8') as f:
-        text = f.read()
-    
-    chars = len(text) if count_spaces else len(text.replace(' ', ''))
-    words = len(text.split())
-    lines = len(text.splitlines())
+        for chunk in iter(lambda: f.read(1 << 20), ''):
+            chars += len(chunk) if count_spaces else len(chunk) - chunk.count(' ')
+            words += len(chunk.split())
+            if in_word and not chunk[0].isspace():
+                words -= 1  # word continues from the previous chunk
+            in_word = not chunk[-1].isspace()
+            breaks += len(chunk.splitlines()) - (chunk[-1] not in LINE_BREAKS)
+            last = chunk[-1]
+    lines = breaks + (last != "" and last not in LINE_BREAKS)
     
     return f"Characters: {chars}\\nWords: {words}\\nLines: {lines}"
 
@@ -367,14 +667,20 @@ def file_info(input_file: str):
         """Load both old and new format plugins."""
         self.plugins = []
         self.advanced_tools = []
+        self._total_count = 0
         
         if not self.plugins_folder.exists():
             return
         
         # Load old format plugins
-        for py_file in self.plugins_folder.glob("*.py"):
-            if py_file.name.startswith("_"):
-                continue
+        with os.scandir(self.plugins_folder) as entries:
+            py_files = sorted(
+                Path(entry.path) for entry in entries
+                if entry.name.endswith(".py") and not entry.name.startswith("_")
+                and entry.is_file()
+            )
+        
+        for py_file in py_files:
             try:
                 plugin = self._load_python_plugin(py_file)
                 if plugin:
@@ -389,16 +695,28 @@ def file_info(input_file: str):
                 self.advanced_tools = self.advanced_loader.get_all_tools()
             except Exception as e:
                 print(f"Error loading advanced plugins: {e}")
+        
+        self._total_count = len(self.plugins) + len(self.advanced_tools)
 
     def _load_python_plugin(self, path):
-        """Load old format plugin."""
+        """Load old format plugin; unchanged files are reused from the last load."""
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+        
+        cached = self._plugin_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        plugin = None
         try:
             spec = importlib.util.spec_from_file_location(path.stem, path)
             module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(module)
             
             if hasattr(module, 'PLUGIN_INFO') and hasattr(module, 'get_buttons'):
-                return {
+                plugin = {
                     "type": "python",
                     "info": module.PLUGIN_INFO,
                     "module": module,
@@ -406,7 +724,9 @@ def file_info(input_file: str):
                 }
         except:
             pass
-        return None
+        
+        self._plugin_cache[path] = (mtime, plugin)
+        return plugin
 
     def execute_plugin_command(self, plugin, command):
         """Execute old format plugin command."""
@@ -419,7 +739,7 @@ def file_info(input_file: str):
         """Open advanced tool in popup window."""
         if ADVANCED_PLUGINS:
             theme = ThemeManager.get_theme()
-            ToolWindow(
+            ToolWindow.open(
                 self.app.window,
                 tool_info,
                 theme,
@@ -427,13 +747,14 @@ def file_info(input_file: str):
             )
 
     def get_total_count(self):
-        """Get total plugins + tools count."""
-        old_count = len(self.plugins)
-        new_count = len(self.advanced_tools)
-        return old_count + new_count
+        """Get total plugins + tools count, as of the last load_plugins."""
+        return self._total_count
 
 
 class Shank2ConverterApp:
+    BG_CACHE_SIZE = 4
+    RESIZE_DELAY_MS = 80
+    
     def __init__(self):
         self.window = tk.Tk()
         self.window.title("Shank 2 Multi-Tool Converter")
@@ -443,6 +764,13 @@ class Shank2ConverterApp:
         
         self.bg_image = None
         self.bg_photo = None
+        self._bg_cache = OrderedDict()  # (width, height) -> (resized image, photo)
+        self._resize_after_id = None
+        self._bg_size = None  # window size the background was last drawn for
+        self._last_pb_style = None
+        self._log_pending = []
+        self._log_flush_id = None
+        self._wheel_delta = 0  # wheel delta not yet scrolled (under one notch)
         self.custom_titlebar_color = None
         self.custom_progress_color = None
         
@@ -478,22 +806,33 @@ class Shank2ConverterApp:
             images_folder.mkdir(exist_ok=True)
             return
         
-        for ext in ["*.png", "*.jpg", "*.jpeg", "*.bmp"]:
-            images = list(images_folder.glob(ext))
-            if images:
-                try:
-                    self.set_background(images[0])
-                    self.log_message(f"[OK] Background: {images[0].name}")
-                    return
-                except:
-                    continue
+        # One directory pass; extensions keep their old priority order
+        priority = {".png": 0, ".jpg": 1, ".jpeg": 2, ".bmp": 3}
+        images = []
+        with os.scandir(images_folder) as entries:
+            for entry in entries:
+                rank = priority.get(os.path.splitext(entry.name)[1].lower())
+                if rank is not None and entry.is_file():
+                    images.append((rank, entry.name, entry.path))
+        
+        if not images or not load_pil():
+            return
+        
+        for _, name, path in sorted(images):
+            try:
+                self.set_background(Path(path))
+                self.log_message(f"[OK] Background: {name}")
+                return
+            except:
+                continue
     
     def set_background(self, image_path):
-        if not PIL_AVAILABLE:
+        if not load_pil():
             return
         
         try:
             self.bg_image = Image.open(image_path)
+            self._bg_cache.clear()
             self.update_background()
             self.auto_adjust_colors()
             self.window.bind("<Configure>", self.on_window_resize)
@@ -508,9 +847,22 @@ class Shank2ConverterApp:
         height = self.window.winfo_height()
         
         if width > 1 and height > 1:
-            resized = self.bg_image.resize((width, height), Image.Resampling.LANCZOS)
-            self.bg_photo = ImageTk.PhotoImage(resized)
+            self.resized_background(width, height)
+            self.bg_photo = self._bg_cache[(width, height)][1]
             self.bg_label.configure(image=self.bg_photo)
+            self._bg_size = (width, height)
+    
+    def resized_background(self, width, height):
+        """Return the background resized to width x height, caching recent sizes"""
+        key = (width, height)
+        cached = self._bg_cache.pop(key, None)
+        if cached is None:
+            resized = self.bg_image.resize(key, Image.Resampling.LANCZOS)
+            cached = (resized, ImageTk.PhotoImage(resized))
+        self._bg_cache[key] = cached
+        while len(self._bg_cache) > self.BG_CACHE_SIZE:
+            self._bg_cache.popitem(last=False)
+        return cached[0]
     
     def auto_adjust_colors(self):
         if self.bg_image is None:
@@ -522,7 +874,8 @@ class Shank2ConverterApp:
             avg_r, avg_g, avg_b = avg_color
             brightness = (avg_r + avg_g + avg_b) // 3
             
-            self.custom_titlebar_color = "#{:02x}{:02x}{:02x}".format(
+            # Kept as an (r, g, b) tuple; set_title_bar_color takes it as is
+            self.custom_titlebar_color = (
                 max(0, avg_r - 20),
                 max(0, avg_g - 20),
                 max(0, avg_b - 20)
@@ -530,15 +883,15 @@ class Shank2ConverterApp:
             set_title_bar_color(self.window, self.custom_titlebar_color)
             
             if brightness > 128:
-                self.custom_progress_color = "#{:02x}{:02x}{:02x}".format(
-                    max(0, 255 - avg_r),
-                    max(0, min(255, avg_g + 50)),
+                self.custom_progress_color = "#%06x" % (
+                    (max(0, 255 - avg_r) << 16) |
+                    (max(0, min(255, avg_g + 50)) << 8) |
                     max(0, 255 - avg_b)
                 )
             else:
-                self.custom_progress_color = "#{:02x}{:02x}{:02x}".format(
-                    min(255, avg_r + 100),
-                    min(255, avg_g + 150),
+                self.custom_progress_color = "#%06x" % (
+                    (min(255, avg_r + 100) << 16) |
+                    (min(255, avg_g + 150) << 8) |
                     min(255, avg_b + 100)
                 )
             
@@ -579,6 +932,12 @@ class Shank2ConverterApp:
         
         bg_color = theme["progress_bg"]
         
+        # Reconfiguring a ttk style walks the theme database; skip repeats
+        key = (fg_color, bg_color)
+        if key == self._last_pb_style:
+            return
+        self._last_pb_style = key
+        
         style = ttk.Style()
         style.theme_use('default')
         
@@ -595,8 +954,18 @@ class Shank2ConverterApp:
         self.progress.configure(style="Custom.Horizontal.TProgressbar")
     
     def on_window_resize(self, event):
+        # A drag fires <Configure> for every pixel; resize once it settles.
+        # Moves and the relayout after our own image change keep the size.
         if event.widget == self.window:
-            self.update_background()
+            if (event.width, event.height) == self._bg_size:
+                return
+            if self._resize_after_id:
+                self.window.after_cancel(self._resize_after_id)
+            self._resize_after_id = self.window.after(self.RESIZE_DELAY_MS, self._finish_resize)
+    
+    def _finish_resize(self):
+        self._resize_after_id = None
+        self.update_background()
     
     def setup_ui(self):
         self.all_buttons = []
@@ -616,9 +985,11 @@ class Shank2ConverterApp:
         self.content_frame.bind("<Configure>", self.on_frame_configure)
         self.canvas.bind("<Configure>", self.on_canvas_configure)
         
-        self.canvas.bind_all("<MouseWheel>", self.on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self.on_mousewheel_linux)
-        self.canvas.bind_all("<Button-5>", self.on_mousewheel_linux)
+        # Bound on the main window's own bindtag rather than "all", so wheel
+        # events from tool windows don't scroll this canvas
+        self.window.bind("<MouseWheel>", self.on_mousewheel)
+        self.window.bind("<Button-4>", self.on_mousewheel_linux)
+        self.window.bind("<Button-5>", self.on_mousewheel_linux)
         
         # Title
         self.title_label = tk.Label(
@@ -835,7 +1206,13 @@ class Shank2ConverterApp:
         self.canvas.itemconfig(self.canvas_window, width=event.width)
     
     def on_mousewheel(self, event):
-        self.canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+        # Touchpads send deltas under one 120 notch; keep the remainder so
+        # small movements scroll the same amount in both directions
+        self._wheel_delta += event.delta
+        steps = int(self._wheel_delta / 120)
+        if steps:
+            self._wheel_delta -= steps * 120
+            self.canvas.yview_scroll(-steps, "units")
     
     def on_mousewheel_linux(self, event):
         if event.num == 4:
@@ -849,32 +1226,34 @@ class Shank2ConverterApp:
         if self.custom_titlebar_color and self.bg_image:
             set_title_bar_color(self.window, self.custom_titlebar_color)
         else:
-            set_title_bar_color(self.window, theme["titlebar"])
+            set_title_bar_color(self.window, ThemeManager.get_rgb("titlebar"))
+        
+        bg, fg, frame_bg = theme["bg"], theme["fg"], theme["frame_bg"]
         
-        self.window.configure(bg=theme["bg"])
-        self.main_container.configure(bg=theme["bg"])
-        self.canvas.configure(bg=theme["bg"])
-        self.content_frame.configure(bg=theme["bg"])
-        self.bg_label.configure(bg=theme["bg"])
+        self.window.configure(bg=bg)
+        self.main_container.configure(bg=bg)
+        self.canvas.configure(bg=bg)
+        self.content_frame.configure(bg=bg)
+        self.bg_label.configure(bg=bg)
         
-        self.title_label.configure(bg=theme["bg"], fg=theme["accent"])
+        self.title_label.configure(bg=bg, fg=theme["accent"])
         
-        for frame in [self.tex_frame, self.lua_frame, self.plugins_frame]:
-            frame.configure(bg=theme["frame_bg"], fg=theme["fg"])
+        for frame in (self.tex_frame, self.lua_frame, self.plugins_frame):
+            frame.configure(bg=frame_bg, fg=fg)
         
-        inner_frames = [
+        inner_frames = (
             self.tex_btn_frame1, self.tex_btn_frame2,
             self.lua_btn_frame1, self.lua_btn_frame2,
             self.plugins_header_frame, self.plugin_buttons_frame,
             self.progress_frame, self.log_outer_frame
-        ]
+        )
         for frame in inner_frames:
-            frame.configure(bg=theme["frame_bg"])
+            frame.configure(bg=frame_bg)
         
-        self.status.configure(bg=theme["bg"], fg=theme["success"])
-        self.plugins_info_label.configure(bg=theme["frame_bg"], fg=theme["fg"])
-        self.log_label.configure(bg=theme["bg"], fg=theme["fg"])
-        self.log.configure(bg="#0f0f1a", fg="#00ff41", insertbackground=theme["fg"])
+        self.status.configure(bg=bg, fg=theme["success"])
+        self.plugins_info_label.configure(bg=frame_bg, fg=fg)
+        self.log_label.configure(bg=bg, fg=fg)
+        self.log.configure(bg="#0f0f1a", fg="#00ff41", insertbackground=fg)
         
         self.update_progress_bar_color()
         
@@ -885,57 +1264,66 @@ class Shank2ConverterApp:
             "activeforeground": theme["button_fg"]
         }
         
+        # Plugin buttons are in all_buttons too, so one pass styles them all
         for btn in self.all_buttons:
             try:
                 btn.configure(**btn_style)
             except:
                 pass
-        
-        for btn in self.plugin_manager.plugin_buttons:
-            try:
-                btn.configure(**btn_style)
-            except:
-                pass
     
     def load_plugin_buttons(self):
-        """Load buttons for all plugins (old + new format)."""
-        for btn in self.plugin_manager.plugin_buttons:
-            btn.destroy()
-        self.plugin_manager.plugin_buttons = []
-
-        theme = ThemeManager.get_theme()
-
+        """Load buttons for all plugins (old + new format).
+        
+        Buttons from the previous load are reconfigured in place, so a
+        reload only creates or destroys the difference in count.
+        """
+        entries = []
+        
         # Old format plugin buttons
         for plugin in self.plugin_manager.plugins:
             for btn_info in plugin.get("buttons", []):
-                btn = tk.Button(
-                    self.plugin_buttons_frame,
-                    text=btn_info.get("text", "Plugin"),
-                    font=("Arial", 10),
-                    bg=theme["button_bg"],
-                    fg=theme["button_fg"],
-                    activebackground=theme["button_active"],
-                    command=lambda p=plugin, c=btn_info.get("command"): 
+                entries.append((
+                    btn_info.get("text", "Plugin"),
+                    lambda p=plugin, c=btn_info.get("command"): 
                         self.plugin_manager.execute_plugin_command(p, c)
-                )
-                btn.pack(side="left", padx=5, pady=5)
-                self.plugin_manager.plugin_buttons.append(btn)
-                self.all_buttons.append(btn)
-
+                ))
+        
         # New format tools (@tool decorator)
         for tool_info in self.plugin_manager.advanced_tools:
-            btn = tk.Button(
-                self.plugin_buttons_frame,
-                text=f"{tool_info['icon']} {tool_info['name']}",
-                font=("Arial", 10),
-                bg=theme["button_bg"],
-                fg=theme["button_fg"],
-                activebackground=theme["button_active"],
-                command=lambda t=tool_info: self.plugin_manager.open_tool_window(t)
-            )
+            entries.append((
+                f"{tool_info['icon']} {tool_info['name']}",
+                lambda t=tool_info: self.plugin_manager.open_tool_window(t)
+            ))
+        
+        theme = ThemeManager.get_theme()
+        btn_kwargs = {
+            "font": ("Arial", 10),
+            "bg": theme["button_bg"],
+            "fg": theme["button_fg"],
+            "activebackground": theme["button_active"]
+        }
+        
+        old_buttons = self.plugin_manager.plugin_buttons
+        reused = old_buttons[:len(entries)]
+        for btn, (text, command) in zip(reused, entries):
+            btn.configure(text=text, command=command, **btn_kwargs)
+        
+        surplus = old_buttons[len(entries):]
+        for btn in surplus:
+            btn.destroy()
+        if surplus:
+            # Drop the destroyed buttons so all_buttons doesn't grow per reload
+            surplus_ids = {id(btn) for btn in surplus}
+            self.all_buttons = [btn for btn in self.all_buttons if id(btn) not in surplus_ids]
+        
+        new_buttons = []
+        for text, command in entries[len(reused):]:
+            btn = tk.Button(self.plugin_buttons_frame, text=text, command=command, **btn_kwargs)
             btn.pack(side="left", padx=5, pady=5)
-            self.plugin_manager.plugin_buttons.append(btn)
-            self.all_buttons.append(btn)
+            new_buttons.append(btn)
+        
+        self.plugin_manager.plugin_buttons = reused + new_buttons
+        self.all_buttons.extend(new_buttons)
 
         # Update count label
         total = self.plugin_manager.get_total_count()
@@ -964,10 +1352,36 @@ class Shank2ConverterApp:
             os.system(f'xdg-open "{folder}"')
     
     def log_message(self, msg):
-        self.log.insert(tk.END, msg + "\n")
-        self.log.see(tk.END)
+        # Lines logged in a burst are written with one insert/see
+        self._log_pending.append(msg + "\n")
+        if self._log_flush_id is None:
+            self._log_flush_id = self.window.after(30, self._flush_pending_log)
+    
+    def _flush_pending_log(self):
+        self._log_flush_id = None
+        if self._log_pending:
+            self.log.insert(tk.END, "".join(self._log_pending))
+            self._log_pending.clear()
+            self.log.see(tk.END)
+    
+    def _flush_log(self, text, progress_value):
+        """Apply a batch of log lines and the progress value from a BatchProgress"""
+        self._flush_pending_log()
+        if text:
+            self.log.insert(tk.END, text)
+            self.log.see(tk.END)
+        self.progress['value'] = progress_value
+    
+    def _finish_batch(self, status_text, success, message):
+        self.status.configure(text=status_text)
+        
+        if success > 0:
+            self.window.after(100, self.trigger_success_flash)
+        
+        messagebox.showinfo("Done", message)
     
     def clear_log(self):
+        self._log_pending.clear()
         self.log.delete(1.0, tk.END)
     
     def reset_ui(self):
@@ -1011,7 +1425,7 @@ class Shank2ConverterApp:
         
         folder_path = filedialog.askdirectory(title="Select Folder")
         if folder_path:
-            files = list(Path(folder_path).glob("*.tex"))
+            files = [Path(entry.path) for entry in list_files(folder_path, ".tex", True)]
             if not files:
                 messagebox.showwarning("Warning", "No TEX files found!")
                 return
@@ -1054,7 +1468,7 @@ class Shank2ConverterApp:
         
         folder_path = filedialog.askdirectory(title="Select Folder")
         if folder_path:
-            files = list(Path(folder_path).glob("*.png"))
+            files = [Path(entry.path) for entry in list_files(folder_path, ".png", True)]
             if not files:
                 messagebox.showwarning("Warning", "No PNG files found!")
                 return
@@ -1065,28 +1479,28 @@ class Shank2ConverterApp:
     def _process_tex_files(self, files, mode):
         total = len(files)
         success = 0
-        for i, file in enumerate(files):
-            try:
-                if mode == "extract":
-                    result = self.tex_converter.extract(file)
-                else:
-                    result = self.tex_converter.rebuild(file)
+        progress = BatchProgress(self, total)
+        
+        # The converter spreads the files over worker processes itself and
+        # pulls them lazily, so each file is read ahead while others convert
+        try:
+            if mode == "extract":
+                results = self.tex_converter.iter_extract(prefetch_files(files))
+            else:
+                results = self.tex_converter.iter_rebuild(prefetch_files(files))
+            
+            for result in results:
                 if result.success:
-                    self.log_message(f"[OK] {file.name}")
+                    progress.log(f"[OK] {result.input_path.name}")
                     success += 1
                 else:
-                    self.log_message(f"[ERROR] {file.name}")
-            except Exception as e:
-                self.log_message(f"[ERROR] {file.name}: {e}")
-            self.progress['value'] = ((i + 1) / total) * 100
-            self.window.update_idletasks()
-        
-        self.status.configure(text=f"Done ({success}/{total})")
-        
-        if success > 0:
-            self.window.after(100, self.trigger_success_flash)
-        
-        messagebox.showinfo("Done", f"Processed {success}/{total} files")
+                    progress.log(f"[ERROR] {result.input_path.name}")
+                progress.advance()
+        except Exception as e:
+            progress.log(f"[ERROR] {e}")
+        finally:
+            progress.finish(f"Done ({success}/{total})", success,
+                            f"Processed {success}/{total} files")
     
     # ==================== LUA FUNCTIONS ====================
     
@@ -1100,12 +1514,11 @@ class Shank2ConverterApp:
             self.reset_ui()
             self.progress['value'] = 50
             try:
-                with open(file_path, 'rb') as f:
-                    if f.read(4) != b'\x1bLua':
-                        messagebox.showerror("Error", "Not a compiled Lua file!")
-                        return
+                if not is_lua_bytecode(file_path, will_read=True):
+                    messagebox.showerror("Error", "Not a compiled Lua file!")
+                    return
                 
-                output_path = file_path.rsplit('.', 1)[0] + '_decompiled.lua'
+                output_path = _swap_ext(file_path, DECOMPILED_SUFFIX)
                 if decompile_file(file_path, output_path):
                     self.log_message(f"[OK] Decompiled: {Path(output_path).name}")
                     self.trigger_success_flash()
@@ -1129,29 +1542,25 @@ class Shank2ConverterApp:
         output_folder = os.path.join(folder_path, "decompiled")
         os.makedirs(output_folder, exist_ok=True)
         
-        files = [f for f in os.listdir(folder_path) if f.endswith('.lua')]
+        files = list_files(folder_path, '.lua')
+        jobs = [(entry.path,
+                 os.path.join(output_folder, _swap_ext(entry.name, '_dec.lua')))
+                for entry in files]
         success = 0
+        progress = BatchProgress(self, len(files))
         
-        for i, filename in enumerate(files):
-            filepath = os.path.join(folder_path, filename)
-            try:
-                with open(filepath, 'rb') as f:
-                    if f.read(4) == b'\x1bLua':
-                        out_path = os.path.join(output_folder, filename.replace('.lua', '_dec.lua'))
-                        if decompile_file(filepath, out_path):
-                            self.log_message(f"[OK] {filename}")
-                            success += 1
-            except Exception as e:
-                self.log_message(f"[ERROR] {filename}: {e}")
-            self.progress['value'] = ((i + 1) / len(files)) * 100
-            self.window.update_idletasks()
-        
-        self.status.configure(text=f"Done ({success})")
-        
-        if success > 0:
-            self.window.after(100, self.trigger_success_flash)
-        
-        messagebox.showinfo("Done", f"Decompiled {success} files")
+        try:
+            for ok, message in iter_parallel(_decompile_worker, jobs):
+                if ok:
+                    success += 1
+                if message:
+                    progress.log(message)
+                progress.advance()
+        except Exception as e:
+            # e.g. a broken worker pool; report it instead of losing the thread
+            progress.log(f"[ERROR] {e}")
+        finally:
+            progress.finish(f"Done ({success})", success, f"Decompiled {success} files")
     
     def compile_lua(self):
         file_path = filedialog.askopenfilename(
@@ -1163,12 +1572,12 @@ class Shank2ConverterApp:
             self.reset_ui()
             self.progress['value'] = 50
             try:
-                with open(file_path, 'rb') as f:
-                    if f.read(4) == b'\x1bLua':
-                        messagebox.showerror("Error", "File already compiled!")
-                        return
+                if is_lua_bytecode(file_path, will_read=True):
+                    messagebox.showerror("Error", "File already compiled!")
+                    return
                 
-                output_path = file_path.replace('_decompiled', '').rsplit('.', 1)[0] + '_compiled.lua'
+                folder, filename = os.path.split(file_path)
+                output_path = os.path.join(folder, _swap_ext(_strip_decompiled(filename), '_compiled.lua'))
                 if compile_lua_file(file_path, output_path):
                     self.log_message(f"[OK] Compiled: {Path(output_path).name}")
                     self.trigger_success_flash()
@@ -1192,34 +1601,31 @@ class Shank2ConverterApp:
         output_folder = os.path.join(folder_path, "compiled")
         os.makedirs(output_folder, exist_ok=True)
         
-        files = [f for f in os.listdir(folder_path) if f.endswith('.lua')]
+        files = list_files(folder_path, '.lua')
+        jobs = [(entry.path,
+                 os.path.join(output_folder, _strip_decompiled(entry.name)))
+                for entry in files]
         success = 0
+        progress = BatchProgress(self, len(files))
         
-        for i, filename in enumerate(files):
-            filepath = os.path.join(folder_path, filename)
-            try:
-                with open(filepath, 'rb') as f:
-                    if f.read(4) != b'\x1bLua':
-                        out_path = os.path.join(output_folder, filename.replace('_decompiled', ''))
-                        if compile_lua_file(filepath, out_path):
-                            self.log_message(f"[OK] {filename}")
-                            success += 1
-            except Exception as e:
-                self.log_message(f"[ERROR] {filename}: {e}")
-            self.progress['value'] = ((i + 1) / len(files)) * 100
-            self.window.update_idletasks()
-        
-        self.status.configure(text=f"Done ({success})")
-        
-        if success > 0:
-            self.window.after(100, self.trigger_success_flash)
-        
-        messagebox.showinfo("Done", f"Compiled {success} files")
+        try:
+            for ok, message in iter_parallel(_compile_worker, jobs):
+                if ok:
+                    success += 1
+                if message:
+                    progress.log(message)
+                progress.advance()
+        except Exception as e:
+            # e.g. a broken worker pool; report it instead of losing the thread
+            progress.log(f"[ERROR] {e}")
+        finally:
+            progress.finish(f"Done ({success})", success, f"Compiled {success} files")
     
     def run(self):
         self.window.mainloop()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     app = Shank2ConverterApp()
     app.run()
\ No newline at end of file
@@ -7,7 +7,10 @@ import importlib.util
 from typing import Callable, Dict, List, Any
 
 
-def tool(name: str = None, description: str = "", icon: str = "<#>", category: str = "General"): # this code is for regist your tool to app as plugin
+_DEFAULT_ICON = "<#>"
+
+
+def tool(name: str = None, description: str = "", icon: str = _DEFAULT_ICON, category: str = "General"): # this code is for regist your tool to app as plugin
     """
     Decorator to register a function as a tool.
     
@@ -17,11 +20,21 @@ def tool(name: str = None, description: str = "", icon: str = "<#>", category: s
             pass
     """ # end regist here
     def decorator(func: Callable):
-        func._tool_info = {
+        meta = {
             'name': name or func.__name__.replace('_', ' ').title(),
             'description': description or func.__doc__ or "No description",
             'icon': icon,
             'category': category,
+        }
+        # Stacked @tool on the same function: the outer one's metadata wins and
+        # the parameters are reused. A functools.wraps wrapper only inherits the
+        # wrapped function's info, so it gets its own.
+        info = getattr(func, '__dict__', {}).get('_tool_info')
+        if info is not None and info['function'] is func:
+            info.update(meta)
+            return func
+        func._tool_info = {
+            **meta,
             'function': func,
             'parameters': _extract_parameters(func)
         }
@@ -29,8 +42,18 @@ def tool(name: str = None, description: str = "", icon: str = "<#>", category: s
     return decorator
 
 
+# Functions with *args / **kwargs go through inspect.signature
+_SLOW_FLAGS = inspect.CO_VARARGS | inspect.CO_VARKEYWORDS
+
+
 def _extract_parameters(func: Callable) -> List[Dict]:
     """Extract parameter info from function signature."""
+    code = func.__code__ if inspect.isfunction(func) else None
+    if (code is not None and not code.co_flags & _SLOW_FLAGS
+            and not code.co_kwonlyargcount and not code.co_posonlyargcount
+            and not hasattr(func, '__wrapped__') and not hasattr(func, '__signature__')):
+        return _extract_simple_parameters(func, code)
+
     params = []
     sig = inspect.signature(func)
     type_hints = getattr(func, '__annotations__', {})
@@ -53,27 +76,73 @@ def _extract_parameters(func: Callable) -> List[Dict]:
     return params
 
 
+def _extract_simple_parameters(func: Callable, code) -> List[Dict]:
+    """Fast path of _extract_parameters for plain positional parameters.
+
+    Reads names from the code object and defaults from __defaults__
+    instead of building an inspect.Signature.
+    """
+    names = code.co_varnames[:code.co_argcount]
+    defaults = func.__defaults__ or ()
+    first_default = len(names) - len(defaults)
+    type_hints = getattr(func, '__annotations__', {})
+
+    params = []
+    for i, param_name in enumerate(names):
+        if param_name in ('app', 'self'):
+            continue
+
+        required = i < first_default
+        params.append({
+            'name': param_name,
+            'type': type_hints.get(param_name, str),
+            'default': None if required else defaults[i - first_default],
+            'required': required
+        })
+
+    return params
+
+
 class AdvancedPluginLoader:
     """Loader for @tool decorated plugins."""
 
     def __init__(self, plugins_folder: str = "plugins"):
         self.plugins_folder = plugins_folder
         self.loaded_tools = {}  # {plugin_name: [tool_info, ...]}
+        self._plugin_cache = {}  # {plugin_name: (mtime_ns, [tool_info, ...])}
 
     def discover_and_load(self) -> Dict[str, List[Dict]]:
-        """Load all plugins and extract @tool functions."""
+        """Load all plugins and extract @tool functions.
+
+        Files unchanged since the last call (same mtime) are not executed
+        again; their tools are reused.
+        """
         if not os.path.exists(self.plugins_folder):
             os.makedirs(self.plugins_folder)
 
         self.loaded_tools.clear()
+        cache = {}
 
         for filename in os.listdir(self.plugins_folder):
             if filename.endswith('.py') and not filename.startswith('_'):
                 plugin_name = filename[:-3]
-                tools = self._load_plugin(plugin_name)
+                try:
+                    mtime = os.stat(os.path.join(self.plugins_folder, filename)).st_mtime_ns
+                except OSError:
+                    continue
+
+                cached = self._plugin_cache.get(plugin_name)
+                if cached and cached[0] == mtime:
+                    tools = cached[1]
+                else:
+                    tools = self._load_plugin(plugin_name)
+                cache[plugin_name] = (mtime, tools)
+
                 if tools:
                     self.loaded_tools[plugin_name] = tools
 
+        # Deleted plugins drop out of the cache
+        self._plugin_cache = cache
         return self.loaded_tools
 
     def _load_plugin(self, plugin_name: str) -> List[Dict]:
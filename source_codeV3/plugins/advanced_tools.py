@@ -4,6 +4,9 @@ Advanced Plugin Example - Using @tool decorator
 from plugin_system import tool
 import os
 
+# Characters str.splitlines() treats as line ends
+LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+
 @tool(
     name="Text Counter",
     description="Counts characters and words in a text file",
@@ -15,11 +18,19 @@ def count_text(input_file: str, count_spaces: bool = True):
     if not os.path.exists(input_file):
         return f"File not found: {input_file}"
     
+    # Stream the file in chunks so large files are never held in memory
+    chars = words = breaks = 0
+    in_word = False
+    last = ""
     with open(input_file, 'r', encoding='utf-8') as f:
-        text = f.read()
-    
-    chars = len(text) if count_spaces else len(text.replace(' ', ''))
-    words = len(text.split())
-    lines = len(text.splitlines())
+        for chunk in iter(lambda: f.read(1 << 20), ''):
+            chars += len(chunk) if count_spaces else len(chunk) - chunk.count(' ')
+            words += len(chunk.split())
+            if in_word and not chunk[0].isspace():
+                words -= 1  # word continues from the previous chunk
+            in_word = not chunk[-1].isspace()
+            breaks += len(chunk.splitlines()) - (chunk[-1] not in LINE_BREAKS)
+            last = chunk[-1]
+    lines = breaks + (last != "" and last not in LINE_BREAKS)
     
     return f"Characters: {chars}\nWords: {words}\nLines: {lines}"
\ No newline at end of file
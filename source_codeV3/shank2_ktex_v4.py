@@ -17,12 +17,18 @@ import sys
 import json
 import time
 import argparse
+import os
+import mmap
+import multiprocessing
+import threading
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Dict
+from typing import List, Tuple, Optional, Dict, NamedTuple, Callable, Iterable, Iterator
 from enum import IntEnum
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
 from functools import lru_cache
+from itertools import chain, islice
+from contextlib import contextmanager
 
 try:
     from PIL import Image
@@ -32,6 +38,12 @@ except ImportError:
     print("ERROR: Pillow required. Install with: pip install Pillow")
     sys.exit(1)
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #                              CONSTANTS
@@ -62,13 +74,37 @@ RGB565_R = tuple((i * 255 + 15) // 31 for i in range(32))
 RGB565_G = tuple((i * 255 + 31) // 63 for i in range(64))
 RGB565_B = tuple((i * 255 + 15) // 31 for i in range(32))
 
+# 1/3-2/3 interpolation of expanded 5-bit (R, B) and 6-bit (G) endpoint pairs:
+# LERP_5[a << 5 | b] == (2 * expand(a) + expand(b)) // 3; swap a, b for 2/3
+LERP_5 = bytes((2 * RGB565_R[a] + RGB565_R[b]) // 3 for a in range(32) for b in range(32))
+LERP_6 = bytes((2 * RGB565_G[a] + RGB565_G[b]) // 3 for a in range(64) for b in range(64))
+
+# Precompiled block layouts (c0, c1, 2-bit indices) and DXT3 explicit alpha
+COLOR_BLOCK = struct.Struct('<HHI')
+U64 = struct.Struct('<Q')
+
+# Header dimension fields at offset 8 (width, height)
+U16 = struct.Struct('<H')
+DIMENSIONS = struct.Struct('<HH')
+
+# Fixed 12-byte header prefix: magic, 2 pad, version, format, width, height
+HEADER_PREFIX = struct.Struct('<4sxxBBHH')
+
+if NUMPY_AVAILABLE:
+    _NP_RGB565_R = np.array(RGB565_R, dtype=np.int32)
+    _NP_RGB565_G = np.array(RGB565_G, dtype=np.int32)
+    _NP_RGB565_B = np.array(RGB565_B, dtype=np.int32)
+    _NP_SHIFT2 = np.arange(16, dtype=np.uint32) * 2
+    _NP_SHIFT3 = np.arange(16, dtype=np.uint64) * 3
+    # c0_565, c1_565, 2-bit indices as stored in a color block
+    _NP_COLOR_BLOCK = np.dtype([('c0', '<u2'), ('c1', '<u2'), ('bits', '<u4')])
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #                              DATA STRUCTURES
 # ══════════════════════════════════════════════════════════════════════════════
 
-@dataclass
-class MipmapInfo:
+class MipmapInfo(NamedTuple):
     level: int
     width: int
     height: int
@@ -85,7 +121,7 @@ class KTEXInfo:
     header_size: int
     has_mipmaps: bool
     mipmap_count: int
-    mipmaps: List[MipmapInfo]
+    mipmaps: Tuple[MipmapInfo, ...]
     raw_header: bytes
     
     def to_dict(self) -> dict:
@@ -113,20 +149,28 @@ class ConversionResult:
 #                              UTILITY FUNCTIONS
 # ══════════════════════════════════════════════════════════════════════════════
 
-@lru_cache(maxsize=65536)
 def rgb565_to_rgb(c: int) -> Tuple[int, int, int]:
-    """Convert RGB565 to RGB888"""
+    """Convert RGB565 to RGB888 (plain table lookups; cheaper than a cache hit)"""
     return (RGB565_R[(c >> 11) & 0x1F],
             RGB565_G[(c >> 5) & 0x3F],
             RGB565_B[c & 0x1F])
 
-@lru_cache(maxsize=262144)
+def color_palette(c0: int, c1: int) -> List[Tuple[int, int, int]]:
+    """4-color DXT palette for RGB565 endpoints (interpolated entries from LUTs)"""
+    r0, g0, b0 = c0 >> 11, (c0 >> 5) & 0x3F, c0 & 0x1F
+    r1, g1, b1 = c1 >> 11, (c1 >> 5) & 0x3F, c1 & 0x1F
+    return [(RGB565_R[r0], RGB565_G[g0], RGB565_B[b0]),
+            (RGB565_R[r1], RGB565_G[g1], RGB565_B[b1]),
+            (LERP_5[r0 << 5 | r1], LERP_6[g0 << 6 | g1], LERP_5[b0 << 5 | b1]),
+            (LERP_5[r1 << 5 | r0], LERP_6[g1 << 6 | g0], LERP_5[b1 << 5 | b0])]
+
 def rgb_to_rgb565(r: int, g: int, b: int) -> int:
     """Convert RGB888 to RGB565"""
     return ((r >> 3) << 11) | ((g >> 2) << 5) | (b >> 3)
 
-def calculate_mipmap_chain(width: int, height: int, fmt: DXTFormat) -> Tuple[List[MipmapInfo], int]:
-    """Calculate all mipmap levels"""
+@lru_cache(maxsize=512)
+def calculate_mipmap_chain(width: int, height: int, fmt: DXTFormat) -> Tuple[Tuple[MipmapInfo, ...], int]:
+    """Calculate all mipmap levels (cached; texture sizes repeat across a batch)"""
     mipmaps = []
     total = 0
     w, h = width, height
@@ -147,7 +191,7 @@ def calculate_mipmap_chain(width: int, height: int, fmt: DXTFormat) -> Tuple[Lis
         h = max(1, h // 2)
         level += 1
     
-    return mipmaps, total
+    return tuple(mipmaps), total
 
 def build_alpha_table(a0: int, a1: int) -> List[int]:
     """Build DXT5 alpha interpolation table"""
@@ -162,6 +206,25 @@ def build_alpha_table(a0: int, a1: int) -> List[int]:
                 (2*a0 + 3*a1) // 5, (1*a0 + 4*a1) // 5,
                 0, 255]
 
+@contextmanager
+def map_file(path: Path):
+    """Read-only memoryview over a file, backed by mmap instead of a heap copy"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield memoryview(b'')
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mm)
+        try:
+            yield view
+        finally:
+            try:
+                view.release()
+                mm.close()
+            except BufferError:
+                # A propagating traceback still holds a view; GC closes the map
+                pass
+
 
 # ══════════════════════════════════════════════════════════════════════════════
 #                              DXT DECODER
@@ -173,8 +236,12 @@ class DXTDecoder:
     @staticmethod
     def decode(data: bytes, width: int, height: int, fmt: DXTFormat) -> Image.Image:
         """Decode DXT data to PIL Image"""
-        image = Image.new('RGBA', (width, height))
-        pixels = image.load()
+        if NUMPY_AVAILABLE:
+            return DXTDecoder._decode_numpy(data, width, height, fmt)
+        
+        # One RGBA framebuffer, handed to PIL in a single call at the end
+        stride = width * 4
+        buf = bytearray(stride * height)
         
         blocks_w = max(1, (width + 3) // 4)
         blocks_h = max(1, (height + 3) // 4)
@@ -196,13 +263,90 @@ class DXTDecoder:
                 else:
                     block_pixels = DXTDecoder._decode_dxt1_block(block)
                 
-                for i, pixel in enumerate(block_pixels):
-                    px = bx * 4 + (i % 4)
-                    py = by * 4 + (i // 4)
-                    if px < width and py < height:
-                        pixels[px, py] = pixel
+                cols = min(4, width - bx * 4)
+                for row in range(min(4, height - by * 4)):
+                    pos = (by * 4 + row) * stride + bx * 16
+                    buf[pos:pos + cols * 4] = bytes(
+                        c for pixel in block_pixels[row * 4:row * 4 + cols] for c in pixel)
         
-        return image
+        return Image.frombytes('RGBA', (width, height), bytes(buf))
+    
+    @staticmethod
+    def _decode_numpy(data: bytes, width: int, height: int, fmt: DXTFormat) -> Image.Image:
+        """Decode all blocks at once with NumPy (same output as the per-block path)"""
+        blocks_w = max(1, (width + 3) // 4)
+        blocks_h = max(1, (height + 3) // 4)
+        block_size = fmt.block_size
+        total = blocks_w * blocks_h
+        count = min(total, len(data) // block_size)
+        
+        # Blocks missing from truncated data stay transparent black
+        out = np.zeros((total, 16, 4), dtype=np.uint8)
+        
+        if count:
+            blk = np.frombuffer(data, dtype=np.uint8, count=count * block_size)
+            blk = blk.reshape(count, block_size)
+            color_off = 0 if fmt == DXTFormat.DXT1 else 8
+            
+            # Color endpoints + 2-bit indices
+            words = blk[:, color_off:color_off + 4].copy().view('<u2')
+            c0, c1 = words[:, 0], words[:, 1]
+            bits = blk[:, color_off + 4:color_off + 8].copy().view('<u4')[:, 0]
+            
+            rgb0 = np.stack((_NP_RGB565_R[(c0 >> 11) & 0x1F],
+                             _NP_RGB565_G[(c0 >> 5) & 0x3F],
+                             _NP_RGB565_B[c0 & 0x1F]), axis=1)
+            rgb1 = np.stack((_NP_RGB565_R[(c1 >> 11) & 0x1F],
+                             _NP_RGB565_G[(c1 >> 5) & 0x3F],
+                             _NP_RGB565_B[c1 & 0x1F]), axis=1)
+            
+            table = np.empty((count, 4, 4), dtype=np.int32)
+            table[:, 0, :3] = rgb0
+            table[:, 1, :3] = rgb1
+            table[:, 2, :3] = (2 * rgb0 + rgb1) // 3
+            table[:, 3, :3] = (rgb0 + 2 * rgb1) // 3
+            table[:, :, 3] = 255
+            
+            if fmt == DXTFormat.DXT1:
+                # c0 <= c1 selects 3-color mode with transparent black
+                three = c0 <= c1
+                table[three, 2, :3] = (rgb0[three] + rgb1[three]) // 2
+                table[three, 3] = 0
+            
+            idx = (bits[:, None] >> _NP_SHIFT2) & 0x3
+            out[:count] = np.take_along_axis(table, idx[:, :, None].astype(np.intp), axis=1)
+            
+            # Alpha
+            if fmt == DXTFormat.DXT3:
+                nibbles = blk[:, 0:8]
+                out[:count, 0::2, 3] = (nibbles & 0xF) * 17
+                out[:count, 1::2, 3] = (nibbles >> 4) * 17
+            elif fmt == DXTFormat.DXT5:
+                a0 = blk[:, 0].astype(np.int32)
+                a1 = blk[:, 1].astype(np.int32)
+                w7 = np.arange(1, 7, dtype=np.int32)
+                w5 = np.arange(1, 5, dtype=np.int32)
+                alpha_table = np.empty((count, 8), dtype=np.int32)
+                alpha_table[:, 0] = a0
+                alpha_table[:, 1] = a1
+                
+                seven = a0 > a1
+                alpha_table[:, 2:8] = ((7 - w7) * a0[:, None] + w7 * a1[:, None]) // 7
+                five = ~seven
+                alpha_table[five, 2:6] = ((5 - w5) * a0[five, None] + w5 * a1[five, None]) // 5
+                alpha_table[five, 6] = 0
+                alpha_table[five, 7] = 255
+                
+                packed = np.zeros((count, 8), dtype=np.uint8)
+                packed[:, :6] = blk[:, 2:8]
+                alpha_bits = packed.view('<u8')[:, 0]
+                a_idx = (alpha_bits[:, None] >> _NP_SHIFT3) & 0x7
+                out[:count, :, 3] = np.take_along_axis(alpha_table, a_idx.astype(np.intp), axis=1)
+        
+        # (blocks, 16, 4) -> (rows, cols, 4), cropped to the image size
+        frame = out.reshape(blocks_h, blocks_w, 4, 4, 4).transpose(0, 2, 1, 3, 4)
+        frame = frame.reshape(blocks_h * 4, blocks_w * 4, 4)[:height, :width]
+        return Image.frombytes('RGBA', (width, height), np.ascontiguousarray(frame).tobytes())
     
     @staticmethod
     def _decode_dxt5_block(block: bytes) -> List[Tuple[int, int, int, int]]:
@@ -213,16 +357,8 @@ class DXTDecoder:
         alpha_bits = sum(block[2+i] << (i*8) for i in range(6))
         
         # Colors
-        c0 = struct.unpack('<H', block[8:10])[0]
-        c1 = struct.unpack('<H', block[10:12])[0]
-        color_bits = struct.unpack('<I', block[12:16])[0]
-        
-        rgb0, rgb1 = rgb565_to_rgb(c0), rgb565_to_rgb(c1)
-        colors = [
-            rgb0, rgb1,
-            tuple((2*rgb0[i] + rgb1[i]) // 3 for i in range(3)),
-            tuple((rgb0[i] + 2*rgb1[i]) // 3 for i in range(3))
-        ]
+        c0, c1, color_bits = COLOR_BLOCK.unpack_from(block, 8)
+        colors = color_palette(c0, c1)
         
         pixels = []
         for i in range(16):
@@ -236,18 +372,10 @@ class DXTDecoder:
     @staticmethod
     def _decode_dxt3_block(block: bytes) -> List[Tuple[int, int, int, int]]:
         """Decode single DXT3 block"""
-        alpha_bits = struct.unpack('<Q', block[0:8])[0]
+        alpha_bits, = U64.unpack_from(block, 0)
         
-        c0 = struct.unpack('<H', block[8:10])[0]
-        c1 = struct.unpack('<H', block[10:12])[0]
-        color_bits = struct.unpack('<I', block[12:16])[0]
-        
-        rgb0, rgb1 = rgb565_to_rgb(c0), rgb565_to_rgb(c1)
-        colors = [
-            rgb0, rgb1,
-            tuple((2*rgb0[i] + rgb1[i]) // 3 for i in range(3)),
-            tuple((rgb0[i] + 2*rgb1[i]) // 3 for i in range(3))
-        ]
+        c0, c1, color_bits = COLOR_BLOCK.unpack_from(block, 8)
+        colors = color_palette(c0, c1)
         
         pixels = []
         for i in range(16):
@@ -261,19 +389,12 @@ class DXTDecoder:
     @staticmethod
     def _decode_dxt1_block(block: bytes) -> List[Tuple[int, int, int, int]]:
         """Decode single DXT1 block"""
-        c0 = struct.unpack('<H', block[0:2])[0]
-        c1 = struct.unpack('<H', block[2:4])[0]
-        bits = struct.unpack('<I', block[4:8])[0]
-        
-        rgb0, rgb1 = rgb565_to_rgb(c0), rgb565_to_rgb(c1)
+        c0, c1, bits = COLOR_BLOCK.unpack_from(block, 0)
         
         if c0 > c1:
-            colors = [
-                rgb0 + (255,), rgb1 + (255,),
-                tuple((2*rgb0[i] + rgb1[i]) // 3 for i in range(3)) + (255,),
-                tuple((rgb0[i] + 2*rgb1[i]) // 3 for i in range(3)) + (255,)
-            ]
+            colors = [rgb + (255,) for rgb in color_palette(c0, c1)]
         else:
+            rgb0, rgb1 = rgb565_to_rgb(c0), rgb565_to_rgb(c1)
             colors = [
                 rgb0 + (255,), rgb1 + (255,),
                 tuple((rgb0[i] + rgb1[i]) // 2 for i in range(3)) + (255,),
@@ -290,189 +411,330 @@ class DXTDecoder:
 class DXTEncoder:
     """High-quality DXT encoder"""
     
-    def __init__(self, use_perceptual: bool = True):
+    def __init__(self, use_perceptual: bool = True, threads: Optional[int] = None):
         self.use_perceptual = use_perceptual
-        # Perceptual weights (ITU-R BT.601)
-        self.weights = (0.299, 0.587, 0.114) if use_perceptual else (1, 1, 1)
+        # Strip threads for the NumPy path (None = one per CPU)
+        self.threads = threads
+        # Perceptual weights (ITU-R BT.601) in 1/1000 fixed point, so color
+        # distances stay integers (max 1000 * 3 * 255^2 fits in int32)
+        self.weights = (299, 587, 114) if use_perceptual else (1, 1, 1)
+        # Per-thread distance scratch for the NumPy path, reused across strips
+        self._scratch = threading.local()
     
     def encode(self, image: Image.Image, fmt: DXTFormat) -> bytes:
         """Encode PIL Image to DXT format"""
+        width, height = image.size
+        blocks = max(1, (width + 3) // 4) * max(1, (height + 3) // 4)
+        
+        result = bytearray(blocks * fmt.block_size)
+        self.encode_into(image, fmt, result)
+        return bytes(result)
+    
+    def encode_into(self, image: Image.Image, fmt: DXTFormat,
+                    out: bytearray, offset: int = 0) -> int:
+        """Encode PIL Image into out[offset:], returning the offset past the last block"""
         if image.mode != 'RGBA':
             image = image.convert('RGBA')
         
-        width, height = image.size
-        pixels = image.load()
+        if NUMPY_AVAILABLE:
+            return self._encode_numpy(image, fmt, out, offset)
+        
+        block_size = fmt.block_size
         
+        # Blocks are packed straight into the caller's buffer
+        encode_block = self._block_encoder(fmt)
+        
+        for block_row in self._block_rows(image):
+            for block_pixels in block_row:
+                encode_block(block_pixels, out, offset)
+                offset += block_size
+        
+        return offset
+    
+    @staticmethod
+    def _block_rows(image: Image.Image):
+        """Yield each row of 4x4 blocks as lists of 16 RGBA pixels (edges repeat)"""
+        width, height = image.size
         blocks_w = max(1, (width + 3) // 4)
         blocks_h = max(1, (height + 3) // 4)
         
-        result = bytearray()
-        
+        # Read the pixels once instead of one PIL access per pixel
+        data = image.tobytes()
+        stride = width * 4
+        pad = blocks_w * 4 - width
         for by in range(blocks_h):
-            for bx in range(blocks_w):
-                # Extract 4x4 block
-                block_pixels = []
-                for py in range(4):
-                    for px in range(4):
-                        x = min(bx * 4 + px, width - 1)
-                        y = min(by * 4 + py, height - 1)
-                        block_pixels.append(pixels[x, y])
-                
-                if fmt == DXTFormat.DXT5:
-                    result.extend(self._encode_dxt5_block(block_pixels))
-                elif fmt == DXTFormat.DXT3:
-                    result.extend(self._encode_dxt3_block(block_pixels))
-                else:
-                    result.extend(self._encode_dxt1_block(block_pixels))
+            # Each source row becomes pixel tuples once, edge-padded to whole blocks
+            rows = []
+            for py in range(4):
+                pos = min(by * 4 + py, height - 1) * stride
+                pixels = list(zip(*[iter(data[pos:pos + stride])] * 4))
+                rows.append(pixels + pixels[-1:] * pad)
+            r0, r1, r2, r3 = rows
+            yield [r0[x:x + 4] + r1[x:x + 4] + r2[x:x + 4] + r3[x:x + 4]
+                   for x in range(0, blocks_w * 4, 4)]
+    
+    @staticmethod
+    def _block_array(image: Image.Image) -> 'np.ndarray':
+        """All 4x4 blocks as an (N, 16, 4) uint8 array, edge-padded like the Python path"""
+        width, height = image.size
+        blocks_w = max(1, (width + 3) // 4)
+        blocks_h = max(1, (height + 3) // 4)
         
-        return bytes(result)
+        arr = np.frombuffer(image.tobytes(), dtype=np.uint8).reshape(height, width, 4)
+        arr = np.pad(arr, ((0, blocks_h * 4 - height), (0, blocks_w * 4 - width), (0, 0)),
+                     mode='edge')
+        blocks = arr.reshape(blocks_h, 4, blocks_w, 4, 4).transpose(0, 2, 1, 3, 4)
+        return blocks.reshape(blocks_h * blocks_w, 16, 4)
     
-    def _color_distance(self, c1: tuple, c2: tuple) -> float:
-        """Weighted color distance"""
-        return sum(self.weights[i] * (c1[i] - c2[i]) ** 2 for i in range(3))
+    # Blocks per work item for threaded NumPy encoding, sized so one strip's
+    # distance scratch (int32 diff + dist per texel and entry) fits L2
+    L2_CACHE_BYTES = 1 << 20
+    STRIP_BLOCKS = max(64, L2_CACHE_BYTES // (16 * 4 * (4 + 4)))
     
-    def _find_endpoints(self, colors: List[tuple]) -> Tuple[tuple, tuple]:
-        """Find best color endpoints"""
-        if not colors:
-            return (0, 0, 0), (255, 255, 255)
-        
-        # Bounding box
-        min_c = [min(c[i] for c in colors) for i in range(3)]
-        max_c = [max(c[i] for c in colors) for i in range(3)]
-        
-        c0 = tuple(max_c)
-        c1 = tuple(min_c)
-        
-        if c0 == c1:
-            c1 = tuple(min(255, c + 1) for c in c0)
+    def _encode_numpy(self, image: Image.Image, fmt: DXTFormat,
+                      out: bytearray, offset: int) -> int:
+        """Encode with NumPy, splitting large images into strips encoded on threads"""
+        blocks = self._block_array(image)
+        # Strips write their blocks in place through a view of the caller's buffer
+        target = np.frombuffer(out, dtype=np.uint8, count=len(blocks) * fmt.block_size,
+                               offset=offset).reshape(len(blocks), fmt.block_size)
+        strips = [(blocks[i:i + self.STRIP_BLOCKS], target[i:i + self.STRIP_BLOCKS])
+                  for i in range(0, len(blocks), self.STRIP_BLOCKS)]
+        workers = min(len(strips), self.threads or os.cpu_count() or 1)
+        if workers <= 1:
+            for strip, dest in strips:
+                self._encode_strip(strip, fmt, dest)
+        else:
+            # NumPy releases the GIL inside its kernels, so strips overlap on real cores
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda job: self._encode_strip(job[0], fmt, job[1]), strips))
         
-        return c0, c1
+        return offset + target.nbytes
     
-    def _encode_dxt5_block(self, pixels: List[tuple]) -> bytes:
-        """Encode 16 pixels to DXT5"""
-        block = bytearray(16)
-        
-        # === Alpha ===
-        alphas = [p[3] for p in pixels]
-        a0, a1 = max(alphas), min(alphas)
-        if a0 == a1:
-            a0 = min(255, a1 + 1)
-        
-        block[0], block[1] = a0, a1
-        alpha_table = build_alpha_table(a0, a1)
+    def _encode_strip(self, blocks: 'np.ndarray', fmt: DXTFormat, out: 'np.ndarray'):
+        """Encode an (N, 16, 4) run of blocks into out (N, block_size), same output as the per-block path"""
+        count = len(blocks)
         
-        # Find best alpha indices
-        alpha_bits = 0
-        for i, a in enumerate(alphas):
-            best_idx = min(range(8), key=lambda idx: abs(a - alpha_table[idx]))
-            alpha_bits |= best_idx << (i * 3)
+        # Channel planes (SoA): each of r, g, b, a is (N, 16) and contiguous
+        r, g, b, a = np.ascontiguousarray(blocks.transpose(2, 0, 1), dtype=np.int32)
         
-        for i in range(6):
-            block[2 + i] = (alpha_bits >> (i * 8)) & 0xFF
+        # === Alpha ===
+        if fmt == DXTFormat.DXT5:
+            a0 = a.max(axis=1)
+            a1 = a.min(axis=1)
+            flat = a0 == a1
+            a0[flat] = np.minimum(a1[flat].astype(np.int32) + 1, 255)
+            out[:, 0] = a0
+            out[:, 1] = a1
+            
+            # Per-block alpha tables (N, 8) as in build_alpha_table: 8-alpha mode, or
+            # 6-alpha mode for the a0 == a1 == 255 blocks the flat fix cannot separate...
+            alpha_table = np.stack(
+                [a0, a1] + [((7 - k) * a0 + k * a1) // 7 for k in range(1, 7)], axis=1)
+            six = a0 <= a1
+            if six.any():
+                e0, e1 = a0[six], a1[six]
+                alpha_table[six] = np.stack(
+                    [e0, e1] + [((5 - k) * e0 + k * e1) // 5 for k in range(1, 5)]
+                    + [np.zeros_like(e0), np.full_like(e0, 255)], axis=1)
+            # ...nearest entry for all 16 texels at once (first minimum wins, as in the LUT)...
+            alpha_idx = np.abs(a[:, :, None] - alpha_table[:, None, :]).argmin(axis=2)
+            
+            # ...then all 16 x 3-bit fields packed per block with one shift-and-sum
+            alpha_bits = (alpha_idx.astype(np.uint64) << _NP_SHIFT3).sum(axis=1, dtype=np.uint64)
+            out[:, 2:8] = alpha_bits.astype('<u8').view(np.uint8).reshape(count, 8)[:, :6]
+        elif fmt == DXTFormat.DXT3:
+            nibbles = a // 17
+            out[:, :8] = nibbles[:, 0::2] | (nibbles[:, 1::2] << 4)
         
         # === Colors ===
-        colors = [(p[0], p[1], p[2]) for p in pixels]
-        c0, c1 = self._find_endpoints(colors)
-        
-        c0_565 = rgb_to_rgb565(*c0)
-        c1_565 = rgb_to_rgb565(*c1)
-        
-        if c0_565 < c1_565:
-            c0_565, c1_565 = c1_565, c0_565
-            c0, c1 = c1, c0
-        
-        block[8:10] = struct.pack('<H', c0_565)
-        block[10:12] = struct.pack('<H', c1_565)
-        
-        # Color table
-        color_table = [
-            c0, c1,
-            tuple((2*c0[i] + c1[i]) // 3 for i in range(3)),
-            tuple((c0[i] + 2*c1[i]) // 3 for i in range(3))
-        ]
-        
-        # Find best color indices
-        color_bits = 0
-        for i, color in enumerate(colors):
-            best_idx = min(range(4), key=lambda idx: self._color_distance(color, color_table[idx]))
-            color_bits |= best_idx << (i * 2)
-        
-        block[12:16] = struct.pack('<I', color_bits)
-        
-        return bytes(block)
+        # Bounding box endpoints per channel -> (3, N); flat blocks get c1 = c0 + 1 (clamped)
+        c0 = np.stack((r.max(axis=1), g.max(axis=1), b.max(axis=1)))
+        c1 = np.stack((r.min(axis=1), g.min(axis=1), b.min(axis=1)))
+        flat = (c0 == c1).all(axis=0)
+        c1[:, flat] = np.minimum(c0[:, flat] + 1, 255)
+        
+        c0_565 = (c0[0] >> 3) << 11 | (c0[1] >> 2) << 5 | c0[2] >> 3
+        c1_565 = (c1[0] >> 3) << 11 | (c1[1] >> 2) << 5 | c1[2] >> 3
+        swap = c0_565 < c1_565
+        c0[:, swap], c1[:, swap] = c1[:, swap], c0[:, swap].copy()
+        c0_565[swap], c1_565[swap] = c1_565[swap], c0_565[swap].copy()
+        if fmt == DXTFormat.DXT1:
+            equal = c0_565 == c1_565
+            c0_565[equal] = np.minimum(c0_565[equal] + 1, 65535)
+        
+        # Per-channel color tables -> (3, N, 4)
+        table = np.stack((c0, c1, (2 * c0 + c1) // 3, (c0 + 2 * c1) // 3), axis=2)
+        
+        # Weighted squared distance of every texel to every table entry -> (N, 16, 4),
+        # exact int32 math fused into two reused buffers (same values as the scalar path)
+        diff, dist = self._strip_scratch(count)
+        for channel, (weight, plane) in enumerate(zip(self.weights, (r, g, b))):
+            np.subtract(plane[:, :, None], table[channel][:, None, :], out=diff)
+            np.multiply(diff, diff, out=diff)
+            if channel == 0:
+                np.multiply(diff, weight, out=dist)
+            else:
+                np.multiply(diff, weight, out=diff)
+                np.add(dist, diff, out=dist)
+        indices = dist.argmin(axis=2).astype(np.uint32)  # first minimum wins, as before
+        
+        colors = np.empty(count, dtype=_NP_COLOR_BLOCK)
+        colors['c0'] = c0_565
+        colors['c1'] = c1_565
+        colors['bits'] = (indices << _NP_SHIFT2).sum(axis=1, dtype=np.uint32)
+        color_off = 0 if fmt == DXTFormat.DXT1 else 8
+        out[:, color_off:color_off + 8] = colors.view(np.uint8).reshape(count, 8)
     
-    def _encode_dxt3_block(self, pixels: List[tuple]) -> bytes:
-        """Encode 16 pixels to DXT3"""
-        block = bytearray(16)
-        
-        # Explicit alpha (4-bit)
-        alpha_bits = 0
-        for i, p in enumerate(pixels):
-            alpha_bits |= (p[3] // 17) << (i * 4)
-        block[0:8] = struct.pack('<Q', alpha_bits)
-        
-        # Colors (same as DXT5)
-        colors = [(p[0], p[1], p[2]) for p in pixels]
-        c0, c1 = self._find_endpoints(colors)
-        
-        c0_565 = rgb_to_rgb565(*c0)
-        c1_565 = rgb_to_rgb565(*c1)
-        
-        if c0_565 < c1_565:
-            c0_565, c1_565 = c1_565, c0_565
-            c0, c1 = c1, c0
-        
-        block[8:10] = struct.pack('<H', c0_565)
-        block[10:12] = struct.pack('<H', c1_565)
-        
-        color_table = [
-            c0, c1,
-            tuple((2*c0[i] + c1[i]) // 3 for i in range(3)),
-            tuple((c0[i] + 2*c1[i]) // 3 for i in range(3))
-        ]
-        
-        color_bits = 0
-        for i, color in enumerate(colors):
-            best_idx = min(range(4), key=lambda idx: self._color_distance(color, color_table[idx]))
-            color_bits |= best_idx << (i * 2)
-        
-        block[12:16] = struct.pack('<I', color_bits)
-        
-        return bytes(block)
+    def _strip_scratch(self, count: int) -> tuple:
+        """This thread's (diff, dist) buffers, viewed for a strip of count blocks"""
+        buffers = getattr(self._scratch, 'buffers', None)
+        if buffers is None or len(buffers[0]) < count:
+            shape = (max(count, self.STRIP_BLOCKS), 16, 4)
+            buffers = (np.empty(shape, dtype=np.int32),
+                       np.empty(shape, dtype=np.int32))
+            self._scratch.buffers = buffers
+        return tuple(buf[:count] for buf in buffers)
     
-    def _encode_dxt1_block(self, pixels: List[tuple]) -> bytes:
-        """Encode 16 pixels to DXT1"""
-        block = bytearray(8)
-        
-        colors = [(p[0], p[1], p[2]) for p in pixels]
-        c0, c1 = self._find_endpoints(colors)
-        
-        c0_565 = rgb_to_rgb565(*c0)
-        c1_565 = rgb_to_rgb565(*c1)
-        
-        if c0_565 < c1_565:
-            c0_565, c1_565 = c1_565, c0_565
-            c0, c1 = c1, c0
-        elif c0_565 == c1_565:
-            c0_565 = min(65535, c0_565 + 1)
-        
-        block[0:2] = struct.pack('<H', c0_565)
-        block[2:4] = struct.pack('<H', c1_565)
-        
-        color_table = [
-            c0, c1,
-            tuple((2*c0[i] + c1[i]) // 3 for i in range(3)),
-            tuple((c0[i] + 2*c1[i]) // 3 for i in range(3))
-        ]
-        
-        color_bits = 0
-        for i, color in enumerate(colors):
-            best_idx = min(range(4), key=lambda idx: self._color_distance(color, color_table[idx]))
-            color_bits |= best_idx << (i * 2)
+    def _block_encoder(self, fmt: DXTFormat) -> Callable[[List[tuple], bytearray, int], None]:
+        """
+        Build the per-block encoder for fmt, specialized once per image.
+        
+        Format checks, weights and helpers are resolved here and bound as
+        closure locals, so the per-block call is straight-line code.
+        """
+        weights = self.weights
+        pick_colors = _pick_color_indices
+        pack_color = COLOR_BLOCK.pack_into
+        color_off = 0 if fmt == DXTFormat.DXT1 else 8
+        # DXT1 needs c0 > c1 to stay in 4-color (opaque) mode
+        bump_equal = fmt == DXTFormat.DXT1
+        
+        def encode_colors(pixels: List[tuple], out: bytearray, offset: int):
+            colors = [p[:3] for p in pixels]
+            rs, gs, bs = zip(*colors)
+            
+            # Bounding box endpoints; flat blocks get c1 = c0 + 1 (clamped)
+            r0, g0, b0 = max(rs), max(gs), max(bs)
+            r1, g1, b1 = min(rs), min(gs), min(bs)
+            if r0 == r1 and g0 == g1 and b0 == b1:
+                r1, g1, b1 = min(255, r0 + 1), min(255, g0 + 1), min(255, b0 + 1)
+            
+            c0_565 = (r0 >> 3) << 11 | (g0 >> 2) << 5 | b0 >> 3
+            c1_565 = (r1 >> 3) << 11 | (g1 >> 2) << 5 | b1 >> 3
+            if c0_565 < c1_565:
+                c0_565, c1_565 = c1_565, c0_565
+                r0, g0, b0, r1, g1, b1 = r1, g1, b1, r0, g0, b0
+            if bump_equal and c0_565 == c1_565:
+                c0_565 = min(65535, c0_565 + 1)
+            
+            color_table = [
+                (r0, g0, b0), (r1, g1, b1),
+                ((2*r0 + r1) // 3, (2*g0 + g1) // 3, (2*b0 + b1) // 3),
+                ((r0 + 2*r1) // 3, (g0 + 2*g1) // 3, (b0 + 2*b1) // 3)
+            ]
+            pack_color(out, offset + color_off, c0_565, c1_565,
+                       pick_colors(colors, color_table, weights))
         
-        block[4:8] = struct.pack('<I', color_bits)
+        if fmt == DXTFormat.DXT1:
+            return encode_colors
         
-        return bytes(block)
+        if fmt == DXTFormat.DXT3:
+            dxt3_alpha = _DXT3_ALPHA
+            pack_alpha = U64.pack_into
+            
+            def encode_dxt3(pixels: List[tuple], out: bytearray, offset: int):
+                # Explicit alpha (4-bit)
+                alphas = bytes([p[3] for p in pixels])
+                pack_alpha(out, offset, _pack_indices(alphas.translate(dxt3_alpha), 4))
+                encode_colors(pixels, out, offset)
+            return encode_dxt3
+        
+        def encode_dxt5(pixels: List[tuple], out: bytearray, offset: int):
+            # Interpolated alpha: endpoints, then 3-bit indices via the per-endpoint LUT
+            alphas = bytes([p[3] for p in pixels])
+            a0, a1 = max(alphas), min(alphas)
+            if a0 == a1:
+                a0 = min(255, a1 + 1)
+            out[offset] = a0
+            out[offset + 1] = a1
+            alpha_bits = _pack_indices(alphas.translate(_alpha_index_lut(a0, a1)), 3)
+            out[offset + 2:offset + 8] = alpha_bits.to_bytes(6, 'little')
+            encode_colors(pixels, out, offset)
+        return encode_dxt5
+
+
+@lru_cache(maxsize=4096)
+def _alpha_index_lut(a0: int, a1: int) -> bytes:
+    """Map every alpha value 0-255 to its closest index in the (a0, a1) table"""
+    table = build_alpha_table(a0, a1)
+    lut = bytearray(256)
+    for a in range(256):
+        # Explicit scan; first minimum wins like min(range(8), key=...)
+        best_idx = 0
+        best_err = abs(a - table[0])
+        for idx in range(1, 8):
+            err = abs(a - table[idx])
+            if err < best_err:
+                best_idx, best_err = idx, err
+        lut[a] = best_idx
+    return bytes(lut)
+
+
+# SWAR masks: keep the low half of every 16/32/64/128-bit lane of a 16-byte int
+_LANE_MASKS = tuple(
+    sum(((1 << (lane // 2)) - 1) << (i * lane) for i in range(128 // lane))
+    for lane in (16, 32, 64, 128)
+)
+
+# Alpha -> 4-bit DXT3 value (a // 17)
+_DXT3_ALPHA = bytes(a // 17 for a in range(256))
+
+
+def _pack_indices(indices: bytes, bits: int) -> int:
+    """Pack 16 one-byte indices into a 16*bits-bit little-endian integer (SWAR)"""
+    v = int.from_bytes(indices, 'little')
+    # Merge neighbouring lanes pairwise: 8 -> 16 -> 32 -> 64 -> 128 bit lanes
+    half, width = 8, bits
+    for mask in _LANE_MASKS:
+        v = (v & mask) | ((v >> half) & mask) << width
+        half, width = half * 2, width * 2
+    return v
+
+
+def _pick_color_indices(colors: List[tuple], color_table: List[tuple], weights: tuple) -> int:
+    """Return packed 2-bit indices of the closest (weighted) color table entries"""
+    wr, wg, wb = weights
+    (r0, g0, b0), (r1, g1, b1), (r2, g2, b2), (r3, g3, b3) = color_table
+    indices = bytearray(16)
+    seen = {}  # blocks often repeat colors; reuse the answer
+    for i, color in enumerate(colors):
+        best = seen.get(color)
+        if best is None:
+            r, g, b = color
+            # Unrolled 4-way search; strict < keeps the first minimum
+            d = wr * (r - r0) ** 2 + wg * (g - g0) ** 2 + wb * (b - b0) ** 2
+            best = 0
+            d1 = wr * (r - r1) ** 2 + wg * (g - g1) ** 2 + wb * (b - b1) ** 2
+            if d1 < d:
+                d, best = d1, 1
+            d2 = wr * (r - r2) ** 2 + wg * (g - g2) ** 2 + wb * (b - b2) ** 2
+            if d2 < d:
+                d, best = d2, 2
+            d3 = wr * (r - r3) ** 2 + wg * (g - g3) ** 2 + wb * (b - b3) ** 2
+            if d3 < d:
+                best = 3
+            seen[color] = best
+        indices[i] = best
+    return _pack_indices(indices, 2)
+
+
+def _batch_worker(job: tuple) -> ConversionResult:
+    """Convert one file for a batch (module level so worker processes can pickle it)"""
+    method, (verbose, png_optimize, quiet, encode_threads), input_path, output_path = job
+    converter = KTEXConverter(verbose=verbose, png_optimize=png_optimize, quiet=quiet,
+                              encode_threads=encode_threads)
+    return getattr(converter, method)(input_path, output_path)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -489,38 +751,48 @@ class KTEXConverter:
     - Version 8: Full mipmaps (88-byte header)
     """
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, png_optimize: bool = False,
+                 quiet: bool = False, encode_threads: Optional[int] = None):
         self.verbose = verbose
-        self.encoder = DXTEncoder()
+        self.png_optimize = png_optimize
+        self.quiet = quiet
+        self.encode_threads = encode_threads
+        self.encoder = DXTEncoder(threads=encode_threads)
+    
+    @property
+    def png_options(self) -> dict:
+        """PNG save options: fast zlib by default, full optimize pass on request"""
+        return {'optimize': True} if self.png_optimize else {'compress_level': 1}
     
     def log(self, msg: str):
         """Print message if verbose"""
         if self.verbose:
             print(f"  {msg}")
     
+    def say(self, msg: str):
+        """Print per-file status unless quiet (errors always print)"""
+        if not self.quiet:
+            print(msg)
+    
     # ──────────────────────────────────────────────────────────────────────────
     #                           HEADER PARSING
     # ──────────────────────────────────────────────────────────────────────────
     
-    def _detect_structure(self, data: bytes) -> KTEXInfo:
+    def _detect_structure(self, data: memoryview) -> KTEXInfo:
         """Auto-detect KTEX structure and parse header"""
-        if len(data) < 12 or data[0:4] != KTEX_MAGIC:
+        if len(data) < HEADER_PREFIX.size:
             raise ValueError("Invalid KTEX file")
         
-        version = data[6]
-        fmt = DXTFormat(data[7])
-        width = struct.unpack('<H', data[8:10])[0]
-        height = struct.unpack('<H', data[10:12])[0]
+        magic, version, fmt_id, width, height = HEADER_PREFIX.unpack_from(data, 0)
+        if magic != KTEX_MAGIC:
+            raise ValueError("Invalid KTEX file")
+        fmt = DXTFormat(fmt_id)
         
         # Calculate possible structures
         blocks_w = max(1, (width + 3) // 4)
         blocks_h = max(1, (height + 3) // 4)
         single_size = blocks_w * blocks_h * fmt.block_size
-        
-        mipmaps, mip_total = calculate_mipmap_chain(width, height, fmt)
-        
         no_mip_header = len(data) - single_size
-        mip_header = len(data) - mip_total
         
         # Detect based on header size validity
         if 12 <= no_mip_header <= 64:
@@ -533,10 +805,15 @@ class KTEXConverter:
                 header_size=no_mip_header,
                 has_mipmaps=False,
                 mipmap_count=1,
-                mipmaps=[MipmapInfo(0, width, height, single_size, 0)],
-                raw_header=data[:no_mip_header]
+                mipmaps=(MipmapInfo(0, width, height, single_size, 0),),
+                raw_header=bytes(data[:no_mip_header])
             )
-        elif 8 <= mip_header <= 256:
+        
+        # Single-level files return above without walking the mip chain
+        mipmaps, mip_total = calculate_mipmap_chain(width, height, fmt)
+        mip_header = len(data) - mip_total
+        
+        if 8 <= mip_header <= 256:
             # Has mipmaps
             return KTEXInfo(
                 version=version,
@@ -547,7 +824,7 @@ class KTEXConverter:
                 has_mipmaps=True,
                 mipmap_count=len(mipmaps),
                 mipmaps=mipmaps,
-                raw_header=data[:mip_header]
+                raw_header=bytes(data[:mip_header])
             )
         else:
             # Fallback: try version-based detection
@@ -560,8 +837,8 @@ class KTEXConverter:
                     header_size=18,
                     has_mipmaps=False,
                     mipmap_count=1,
-                    mipmaps=[MipmapInfo(0, width, height, single_size, 0)],
-                    raw_header=data[:18]
+                    mipmaps=(MipmapInfo(0, width, height, single_size, 0),),
+                    raw_header=bytes(data[:18])
                 )
             elif version == 5:
                 return KTEXInfo(
@@ -573,7 +850,7 @@ class KTEXConverter:
                     has_mipmaps=True,
                     mipmap_count=len(mipmaps),
                     mipmaps=mipmaps,
-                    raw_header=data[:10]
+                    raw_header=bytes(data[:10])
                 )
             elif version == 8:
                 return KTEXInfo(
@@ -585,7 +862,7 @@ class KTEXConverter:
                     has_mipmaps=True,
                     mipmap_count=len(mipmaps),
                     mipmaps=mipmaps,
-                    raw_header=data[:88]
+                    raw_header=bytes(data[:88])
                 )
             else:
                 raise ValueError(f"Unknown KTEX version: {version}")
@@ -601,40 +878,39 @@ class KTEXConverter:
         input_path = Path(input_path)
         
         try:
-            # Read file
-            with open(input_path, 'rb') as f:
-                data = f.read()
-            
-            # Parse structure
-            info = self._detect_structure(data)
-            
-            print(f"📄 {input_path.name}")
-            print(f"   Dimensions: {info.width}x{info.height}")
-            print(f"   Format: {info.format.name_str}")
-            print(f"   Version: {info.version} ({'mipmaps' if info.has_mipmaps else 'no mipmaps'})")
-            print(f"   Header: {info.header_size} bytes")
-            
-            # Set output path
-            if output_path is None:
-                output_path = input_path.with_suffix('.png')
-            output_path = Path(output_path)
-            
-            # Decode main image
-            mip0 = info.mipmaps[0]
-            image_data = data[info.header_size:info.header_size + mip0.size]
-            
-            image = DXTDecoder.decode(image_data, mip0.width, mip0.height, info.format)
-            
-            # Save PNG
-            image.save(output_path, 'PNG', optimize=True)
-            print(f"   ✓ Saved: {output_path.name}")
-            
-            # Save metadata
-            self._save_metadata(output_path, info)
-            
-            # Extract mipmaps if requested
-            if extract_all_mipmaps and info.has_mipmaps:
-                self._extract_mipmaps(data, info, input_path)
+            # Map file; block data is decoded straight from the page cache
+            with map_file(input_path) as data:
+                # Parse structure
+                info = self._detect_structure(data)
+                
+                self.say(f"📄 {input_path.name}")
+                self.say(f"   Dimensions: {info.width}x{info.height}")
+                self.say(f"   Format: {info.format.name_str}")
+                self.say(f"   Version: {info.version} ({'mipmaps' if info.has_mipmaps else 'no mipmaps'})")
+                self.say(f"   Header: {info.header_size} bytes")
+                
+                # Set output path
+                if output_path is None:
+                    output_path = input_path.with_suffix('.png')
+                output_path = Path(output_path)
+                
+                # Decode main image
+                mip0 = info.mipmaps[0]
+                image_data = data[info.header_size:info.header_size + mip0.size]
+                
+                image = DXTDecoder.decode(image_data, mip0.width, mip0.height, info.format)
+                del image_data
+                
+                # Save PNG
+                image.save(output_path, 'PNG', **self.png_options)
+                self.say(f"   ✓ Saved: {output_path.name}")
+                
+                # Save metadata
+                self._save_metadata(output_path, info)
+                
+                # Extract mipmaps if requested
+                if extract_all_mipmaps and info.has_mipmaps:
+                    self._extract_mipmaps(data, info, input_path)
             
             return ConversionResult(
                 success=True,
@@ -644,7 +920,7 @@ class KTEXConverter:
             )
             
         except Exception as e:
-            print(f"   ✗ Error: {e}")
+            print(f"   ✗ Error: {input_path.name}: {e}")
             return ConversionResult(
                 success=False,
                 input_path=input_path,
@@ -666,7 +942,7 @@ class KTEXConverter:
         
         self.log(f"Metadata: {json_path.name}")
     
-    def _extract_mipmaps(self, data: bytes, info: KTEXInfo, input_path: Path):
+    def _extract_mipmaps(self, data: memoryview, info: KTEXInfo, input_path: Path):
         """Extract all mipmap levels"""
         offset = info.header_size
         
@@ -675,8 +951,8 @@ class KTEXConverter:
             mip_image = DXTDecoder.decode(mip_data, mip.width, mip.height, info.format)
             
             mip_path = input_path.with_name(f"{input_path.stem}_mip{mip.level}.png")
-            mip_image.save(mip_path, 'PNG')
-            print(f"   Mip {mip.level}: {mip.width}x{mip.height}")
+            mip_image.save(mip_path, 'PNG', **self.png_options)
+            self.say(f"   Mip {mip.level}: {mip.width}x{mip.height}")
             
             offset += mip.size
     
@@ -696,8 +972,8 @@ class KTEXConverter:
             image = Image.open(input_path).convert('RGBA')
             width, height = image.size
             
-            print(f"📄 {input_path.name}")
-            print(f"   Dimensions: {width}x{height}")
+            self.say(f"📄 {input_path.name}")
+            self.say(f"   Dimensions: {width}x{height}")
             
             # Set output path
             if output_path is None:
@@ -712,8 +988,8 @@ class KTEXConverter:
             has_mipmaps = meta.get('has_mipmaps', True) if force_mipmaps is None else force_mipmaps
             version = meta.get('version', 8 if has_mipmaps else 1)
             
-            print(f"   Format: {fmt.name_str}")
-            print(f"   Mipmaps: {'Yes' if has_mipmaps else 'No'}")
+            self.say(f"   Format: {fmt.name_str}")
+            self.say(f"   Mipmaps: {'Yes' if has_mipmaps else 'No'}")
             
             # Generate texture data
             if has_mipmaps:
@@ -726,8 +1002,7 @@ class KTEXConverter:
             if header_data and len(header_data) >= 12:
                 # Update existing header
                 header = bytearray(header_data)
-                header[8:10] = struct.pack('<H', width)
-                header[10:12] = struct.pack('<H', height)
+                DIMENSIONS.pack_into(header, 8, width, height)
                 final_data = bytes(header) + texture_data
             else:
                 # Create new header
@@ -738,7 +1013,7 @@ class KTEXConverter:
             with open(output_path, 'wb') as f:
                 f.write(final_data)
             
-            print(f"   ✓ Saved: {output_path.name} ({len(final_data):,} bytes)")
+            self.say(f"   ✓ Saved: {output_path.name} ({len(final_data):,} bytes)")
             
             return ConversionResult(
                 success=True,
@@ -748,7 +1023,7 @@ class KTEXConverter:
             )
             
         except Exception as e:
-            print(f"   ✗ Error: {e}")
+            print(f"   ✗ Error: {input_path.name}: {e}")
             return ConversionResult(
                 success=False,
                 input_path=input_path,
@@ -791,16 +1066,21 @@ class KTEXConverter:
     def _encode_with_mipmaps(self, image: Image.Image, mipmaps: List[MipmapInfo], 
                              fmt: DXTFormat) -> bytes:
         """Encode image with all mipmap levels"""
-        result = bytearray()
+        # Every level is encoded in place into one buffer sized for the whole chain
+        result = bytearray(sum(mip.size for mip in mipmaps))
+        offset = 0
+        mip_image = image
         
         for mip in mipmaps:
+            # Each level is box-filtered from the previous one, not resampled from level 0
             if mip.level > 0:
-                mip_image = image.resize((mip.width, mip.height), Image.Resampling.LANCZOS)
-            else:
-                mip_image = image
+                size = (mip.width, mip.height)
+                if mip_image.size == (mip.width * 2, mip.height * 2):
+                    mip_image = mip_image.reduce(2)
+                else:
+                    mip_image = mip_image.resize(size, Image.Resampling.BOX)
             
-            mip_data = self.encoder.encode(mip_image, fmt)
-            result.extend(mip_data)
+            offset = self.encoder.encode_into(mip_image, fmt, result, offset)
             self.log(f"Mip {mip.level}: {mip.width}x{mip.height}")
         
         return bytes(result)
@@ -815,8 +1095,7 @@ class KTEXConverter:
             header[0:4] = KTEX_MAGIC
             header[6] = version
             header[7] = int(fmt)
-            header[8:10] = struct.pack('<H', width)
-            header[10:12] = struct.pack('<H', height)
+            DIMENSIONS.pack_into(header, 8, width, height)
             # Mipmap table would go here (simplified)
             return bytes(header)
         
@@ -826,7 +1105,7 @@ class KTEXConverter:
             header[0:4] = KTEX_MAGIC
             header[6] = version
             header[7] = int(fmt)
-            header[8:10] = struct.pack('<H', width)
+            U16.pack_into(header, 8, width)
             # Height encoded differently?
             return bytes(header)
         
@@ -836,8 +1115,7 @@ class KTEXConverter:
             header[0:4] = KTEX_MAGIC
             header[6] = 1
             header[7] = int(fmt)
-            header[8:10] = struct.pack('<H', width)
-            header[10:12] = struct.pack('<H', height)
+            DIMENSIONS.pack_into(header, 8, width, height)
             return bytes(header)
     
     # ──────────────────────────────────────────────────────────────────────────
@@ -845,36 +1123,96 @@ class KTEXConverter:
     # ──────────────────────────────────────────────────────────────────────────
     
     def batch_extract(self, files: List[Path], output_dir: Optional[Path] = None,
-                      workers: int = 4) -> List[ConversionResult]:
-        """Extract multiple files"""
-        results = []
-        
-        if output_dir:
-            output_dir = Path(output_dir)
-            output_dir.mkdir(parents=True, exist_ok=True)
-        
-        for f in files:
-            f = Path(f)
-            out = output_dir / f.with_suffix('.png').name if output_dir else None
-            results.append(self.extract(f, out))
-        
-        return results
+                      workers: Optional[int] = None,
+                      progress: Optional[Callable[[int, int, ConversionResult], None]] = None
+                      ) -> List[ConversionResult]:
+        """Extract multiple files (in parallel worker processes)"""
+        return self._run_batch('extract', '.png', files, output_dir, workers, progress)
     
     def batch_rebuild(self, files: List[Path], output_dir: Optional[Path] = None,
-                      workers: int = 4) -> List[ConversionResult]:
-        """Rebuild multiple files"""
-        results = []
+                      workers: Optional[int] = None,
+                      progress: Optional[Callable[[int, int, ConversionResult], None]] = None
+                      ) -> List[ConversionResult]:
+        """Rebuild multiple files (in parallel worker processes)"""
+        return self._run_batch('rebuild', '.tex', files, output_dir, workers, progress)
+    
+    def iter_extract(self, files: Iterable[Path], output_dir: Optional[Path] = None,
+                     workers: Optional[int] = None) -> Iterator[ConversionResult]:
+        """Extract files lazily, yielding each result as it finishes (caller reports)"""
+        for _, result in self._iter_batch('extract', '.png', files, output_dir, workers, True):
+            yield result
+    
+    def iter_rebuild(self, files: Iterable[Path], output_dir: Optional[Path] = None,
+                     workers: Optional[int] = None) -> Iterator[ConversionResult]:
+        """Rebuild files lazily, yielding each result as it finishes (caller reports)"""
+        for _, result in self._iter_batch('rebuild', '.tex', files, output_dir, workers, True):
+            yield result
+    
+    def _run_batch(self, method: str, suffix: str, files: List[Path],
+                   output_dir: Optional[Path], workers: Optional[int],
+                   progress: Optional[Callable[[int, int, ConversionResult], None]] = None
+                   ) -> List[ConversionResult]:
+        """
+        Run extract/rebuild over files; results keep the input order.
+        progress(done, total, result) is called as each file finishes and
+        replaces the per-file status output of the workers.
+        """
+        files = list(files)
+        total = len(files)
+        results: List[Optional[ConversionResult]] = [None] * total
+        workers = min(workers or os.cpu_count() or 1, total)
+        
+        # Per-file chatter is dropped when a progress callback reports instead
+        quiet = self.quiet or progress is not None
+        batch = self._iter_batch(method, suffix, files, output_dir, workers, quiet)
+        for done, (i, result) in enumerate(batch, 1):
+            results[i] = result
+            if progress:
+                progress(done, total, result)
         
+        return results
+    
+    def _iter_batch(self, method: str, suffix: str, files: Iterable[Path],
+                    output_dir: Optional[Path], workers: Optional[int],
+                    quiet: bool) -> Iterator[Tuple[int, ConversionResult]]:
+        """
+        Run extract/rebuild over files as they are produced, yielding
+        (index, result) in completion order. At most two jobs per worker
+        are in flight, so huge batches are never held in memory.
+        """
         if output_dir:
             output_dir = Path(output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
         
-        for f in files:
-            f = Path(f)
-            out = output_dir / f.with_suffix('.tex').name if output_dir else None
-            results.append(self.rebuild(f, out))
-        
-        return results
+        workers = workers or os.cpu_count() or 1
+        # Worker processes already use every core, so each encodes its strips inline
+        encode_threads = 1 if workers > 1 else self.encode_threads
+        settings = (self.verbose, self.png_optimize, quiet, encode_threads)
+        jobs = enumerate(
+            (method, settings, Path(f), output_dir / Path(f).with_suffix(suffix).name if output_dir else None)
+            for f in files)
+        
+        if workers <= 1:
+            for i, job in jobs:
+                yield i, _batch_worker(job)
+            return
+        
+        # DXT coding is CPU-bound Python, so use processes rather than threads
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = {}
+            while True:
+                for i, job in islice(jobs, workers * 2 - len(pending)):
+                    pending[executor.submit(_batch_worker, job)] = (i, job[2])
+                if not pending:
+                    break
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    i, input_path = pending.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:  # worker died (e.g. out of memory)
+                        result = ConversionResult(success=False, input_path=input_path, error=str(e))
+                    yield i, result
     
     # ──────────────────────────────────────────────────────────────────────────
     #                           FILE INFO
@@ -885,15 +1223,14 @@ class KTEXConverter:
         input_path = Path(input_path)
         
         try:
-            with open(input_path, 'rb') as f:
-                data = f.read()
-            
-            info = self._detect_structure(data)
+            with map_file(input_path) as data:
+                info = self._detect_structure(data)
+                file_size = len(data)
             
             print(f"\n{'='*50}")
             print(f" {input_path.name}")
             print(f"{'='*50}")
-            print(f" Size:       {len(data):,} bytes")
+            print(f" Size:       {file_size:,} bytes")
             print(f" Dimensions: {info.width} x {info.height}")
             print(f" Format:     {info.format.name_str}")
             print(f" Version:    {info.version}")
@@ -917,17 +1254,33 @@ class KTEXConverter:
 #                              CLI INTERFACE
 # ══════════════════════════════════════════════════════════════════════════════
 
-def expand_wildcards(patterns: List[str]) -> List[Path]:
-    """Expand wildcard patterns to file list"""
+def expand_wildcards(patterns: List[str]) -> Iterator[Path]:
+    """Expand wildcard patterns to files, lazily (unmatched patterns pass through)"""
     import glob
-    files = []
     for pattern in patterns:
-        expanded = glob.glob(pattern)
-        if expanded:
-            files.extend(Path(p) for p in expanded)
-        else:
-            files.append(Path(pattern))
-    return files
+        matched = False
+        for p in glob.iglob(pattern):
+            matched = True
+            yield Path(p)
+        if not matched:
+            yield Path(pattern)
+
+def print_progress(done: int, total: Optional[int], result: ConversionResult):
+    """Batch progress line for the CLI"""
+    mark = '✓' if result.success else '✗'
+    count = f"{done}/{total}" if total else f"{done}"
+    print(f"[{count}] {mark} {Path(result.input_path).name}")
+
+def report_batch(results: Iterable[ConversionResult],
+                 progress: Optional[Callable[[int, Optional[int], ConversionResult], None]]
+                 ) -> Tuple[int, int]:
+    """Report streamed batch results; returns (done, succeeded)"""
+    done = success = 0
+    for done, result in enumerate(results, 1):
+        success += result.success
+        if progress:
+            progress(done, None, result)
+    return done, success
 
 def main():
     parser = argparse.ArgumentParser(
@@ -960,7 +1313,11 @@ Windows wildcard workaround:
                         help='Extract all mipmaps / Force mipmaps on rebuild')
     parser.add_argument('--no-mipmaps', action='store_true',
                         help='Force no mipmaps on rebuild')
+    parser.add_argument('--png-optimize', action='store_true',
+                        help='Smallest PNGs on extract (slower)')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
+    parser.add_argument('-q', '--quiet', action='store_true',
+                        help='Only print errors and the batch summary')
     parser.add_argument('--json', action='store_true', help='Output info as JSON')
     
     args = parser.parse_args()
@@ -972,29 +1329,33 @@ Windows wildcard workaround:
 ╚══════════════════════════════════════════════════════════════════════════════╝
     """)
     
-    converter = KTEXConverter(verbose=args.verbose)
+    converter = KTEXConverter(verbose=args.verbose, png_optimize=args.png_optimize,
+                              quiet=args.quiet)
+    progress = None if args.quiet else print_progress
     
-    # Expand input files
+    # Expand input files lazily; peek far enough to tell single file from batch
     input_files = expand_wildcards(args.input)
+    head = list(islice(input_files, 2))
+    single = len(head) == 1
+    input_files = chain(head, input_files)
     
     if args.command == 'extract':
-        if len(input_files) == 1 and args.output and not Path(args.output).suffix:
+        if single and args.output and not Path(args.output).suffix:
             # Single file to directory
             output_dir = Path(args.output)
             output_dir.mkdir(parents=True, exist_ok=True)
-            out_path = output_dir / input_files[0].with_suffix('.png').name
-            converter.extract(input_files[0], out_path, args.mipmaps)
-        elif len(input_files) == 1:
+            out_path = output_dir / head[0].with_suffix('.png').name
+            converter.extract(head[0], out_path, args.mipmaps)
+        elif single:
             # Single file
             out_path = Path(args.output) if args.output else None
-            converter.extract(input_files[0], out_path, args.mipmaps)
+            converter.extract(head[0], out_path, args.mipmaps)
         else:
-            # Batch
+            # Batch, streamed: results are reported and counted as they finish
             output_dir = Path(args.output) if args.output else None
-            results = converter.batch_extract(input_files, output_dir)
-            
-            success = sum(1 for r in results if r.success)
-            print(f"\n✓ Completed: {success}/{len(results)} succeeded")
+            results = converter.iter_extract(input_files, output_dir)
+            done, success = report_batch(results, progress)
+            print(f"\n✓ Completed: {success}/{done} succeeded")
     
     elif args.command == 'rebuild':
         force_mipmaps = None
@@ -1005,15 +1366,14 @@ Windows wildcard workaround:
         
         original = Path(args.original) if args.original else None
         
-        if len(input_files) == 1:
+        if single:
             out_path = Path(args.output) if args.output else None
-            converter.rebuild(input_files[0], out_path, original, force_mipmaps)
+            converter.rebuild(head[0], out_path, original, force_mipmaps)
         else:
             output_dir = Path(args.output) if args.output else None
-            results = converter.batch_rebuild(input_files, output_dir)
-            
-            success = sum(1 for r in results if r.success)
-            print(f"\n✓ Completed: {success}/{len(results)} succeeded")
+            results = converter.iter_rebuild(input_files, output_dir)
+            done, success = report_batch(results, progress)
+            print(f"\n✓ Completed: {success}/{done} succeeded")
     
     elif args.command == 'info':
         all_info = []
@@ -1027,4 +1387,5 @@ Windows wildcard workaround:
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()  # batch workers in frozen (PyInstaller) builds
     main()
\ No newline at end of file
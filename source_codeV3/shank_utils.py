@@ -3,6 +3,10 @@ Shank Game Utilities Plugin
 """
 from plugin_system import tool
 import os
+import struct
+
+# magic, version, width, height
+_TEX_HEADER = struct.Struct('<4sIII')
 
 
 @tool(
@@ -16,11 +20,15 @@ def tex_info(input_file: str):
     if not os.path.exists(input_file):
         return f"File not found: {input_file}"
     
-    with open(input_file, 'rb') as f:
-        magic = f.read(4)
-        version = int.from_bytes(f.read(4), 'little')
-        width = int.from_bytes(f.read(4), 'little')
-        height = int.from_bytes(f.read(4), 'little')
+    fd = os.open(input_file, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        header = os.read(fd, _TEX_HEADER.size)
+    finally:
+        os.close(fd)
+    
+    # Short files read as zeros past the end, like the per-field reads did
+    _, version, width, height = _TEX_HEADER.unpack(header.ljust(_TEX_HEADER.size, b'\0'))
+    magic = header[:4]
     
     return f"""TEX File Info:
     
@@ -50,7 +58,14 @@ def batch_backup(source_folder: str, backup_suffix: str = "_backup"):
     if backup_folder.exists():
         return f"Backup already exists: {backup_folder}"
     
-    shutil.copytree(src, backup_folder)
+    # Count files as they are copied rather than walking the copy again
+    file_count = 0
+    
+    def copy_and_count(source, destination, *, follow_symlinks=True):
+        nonlocal file_count
+        file_count += 1
+        return shutil.copy2(source, destination, follow_symlinks=follow_symlinks)
+    
+    shutil.copytree(src, backup_folder, copy_function=copy_and_count)
     
-    file_count = len(list(backup_folder.rglob('*')))
     return f"Backup created!\n\nLocation: {backup_folder}\nFiles: {file_count}"
\ No newline at end of file